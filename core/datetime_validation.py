@@ -1,6 +1,7 @@
 # core/datetime_validation.py
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Tuple, Optional
 
 class DateTimeValidator:
@@ -17,6 +18,10 @@ class DateTimeValidator:
         r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$',      # YYYY-MM-DDThh:mm:ssZ
         r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+$',  # YYYY-MM-DDThh:mm:ss.sss
     ]
+    
+    # Compiled once at import; these run on every keystroke in datetime fields
+    _SEISCOMP_RE = re.compile(SEISCOMP_PATTERN)
+    _ALTERNATIVE_RES = tuple(re.compile(pattern) for pattern in ALTERNATIVE_PATTERNS)
 
     @classmethod
     def validate(cls, text: str) -> bool:
@@ -29,19 +34,7 @@ class DateTimeValidator:
         Returns:
             bool: True if valid, False otherwise
         """
-        if not text:  # Empty is valid
-            return True
-            
-        # Check if already in SeisComP format
-        if re.match(cls.SEISCOMP_PATTERN, text):
-            return cls._validate_components(text)
-            
-        # Check alternative formats
-        for pattern in cls.ALTERNATIVE_PATTERNS:
-            if re.match(pattern, text):
-                return cls._validate_components(text)
-                
-        return False
+        return _validate_cached(text)
 
     @classmethod
     def convert_to_seiscomp_format(cls, text: str) -> Optional[str]:
@@ -54,11 +47,38 @@ class DateTimeValidator:
         Returns:
             str: Converted datetime string or None if invalid
         """
+        return _convert_cached(text)
+
+    @classmethod
+    def _validate(cls, text: str) -> bool:
+        """Uncached implementation of validate"""
+        if not text:  # Empty is valid
+            return True
+            
+        # Fixed-width layouts are checked with a single character scan
+        result = cls._scan_fixed_layout(text)
+        if result is not None:
+            return result
+            
+        # Check if already in SeisComP format
+        if cls._SEISCOMP_RE.match(text):
+            return cls._validate_components(text)
+            
+        # Check alternative formats
+        for pattern in cls._ALTERNATIVE_RES:
+            if pattern.match(text):
+                return cls._validate_components(text)
+                
+        return False
+
+    @classmethod
+    def _convert(cls, text: str) -> Optional[str]:
+        """Uncached implementation of convert_to_seiscomp_format"""
         if not text:
             return None
             
         # Already in SeisComP format
-        if re.match(cls.SEISCOMP_PATTERN, text):
+        if cls._SEISCOMP_RE.match(text):
             return text if cls._validate_components(text) else None
             
         try:
@@ -100,6 +120,77 @@ class DateTimeValidator:
         except (ValueError, IndexError):
             return None
 
+    # Byte offsets of the digits in YYYY-MM-DD[T ]hh:mm:ss[.ssssZ]
+    _DATE_DIGITS = (0, 1, 2, 3, 5, 6, 8, 9)
+    _DATETIME_DIGITS = _DATE_DIGITS + (11, 12, 14, 15, 17, 18)
+    _SEISCOMP_DIGITS = _DATETIME_DIGITS + (20, 21, 22, 23)
+
+    @classmethod
+    def _scan_fixed_layout(cls, text: str) -> Optional[bool]:
+        """
+        Validate fixed-width datetime layouts without regex or splitting
+        
+        Handles YYYY-MM-DD[T ]hh:mm:ss, YYYY-MM-DDThh:mm:ssZ and the
+        SeisComP format YYYY-MM-DDThh:mm:ss.ssssZ by checking separators
+        at fixed byte offsets and digit values by arithmetic. Date-only
+        input is rejected, as the component check always did; it is still
+        accepted by convert_to_seiscomp_format.
+        
+        Args:
+            text: Datetime string to validate
+            
+        Returns:
+            bool: Validation result, or None if the layout is not handled here
+        """
+        length = len(text)
+        if length == 25:
+            if text[24] != 'Z':
+                return None  # Variable-length fraction, leave to the regex path
+            digit_positions = cls._SEISCOMP_DIGITS
+        elif length == 10:
+            return False  # Date without a time is not a complete datetime
+        elif length in (19, 20):
+            digit_positions = cls._DATETIME_DIGITS
+        else:
+            return None
+            
+        try:
+            raw = text.encode('ascii')
+        except UnicodeEncodeError:
+            return None
+            
+        # Separators: '-' '-' [ 'T'|' ' ':' ':' [ 'Z' | '.' ... 'Z' ] ]
+        if raw[4] != 0x2D or raw[7] != 0x2D:
+            return False
+        if length > 10:
+            if raw[13] != 0x3A or raw[16] != 0x3A:
+                return False
+            if length == 19:
+                if raw[10] != 0x54 and raw[10] != 0x20:
+                    return False
+            elif raw[10] != 0x54:
+                return False
+            if length == 20 and raw[19] != 0x5A:
+                return False
+            if length == 25 and raw[19] != 0x2E:
+                return False
+                
+        # Digit value of every byte; one range check covers all positions
+        d = [b - 0x30 for b in raw]
+        if not all(0 <= d[i] <= 9 for i in digit_positions):
+            return False
+            
+        year = d[0] * 1000 + d[1] * 100 + d[2] * 10 + d[3]
+        month = d[5] * 10 + d[6]
+        day = d[8] * 10 + d[9]
+        if not cls._validate_date(year, month, day):
+            return False
+            
+        hour = d[11] * 10 + d[12]
+        minute = d[14] * 10 + d[15]
+        second = d[17] * 10 + d[18]
+        return cls._validate_time(hour, minute, second)
+
     @staticmethod
     def _validate_date(year: int, month: int, day: int) -> bool:
         """Validate date components"""
@@ -125,32 +216,24 @@ class DateTimeValidator:
 
     @classmethod
     def _validate_components(cls, text: str) -> bool:
-        """Validate all datetime components"""
+        """Validate all datetime components of a pattern-matched string"""
+        # The patterns have fixed the layout and the fraction digits, so only
+        # the calendar and clock values of the whole-second part need checking
+        if len(text) == 10:
+            return False  # Date only, rejected as by the original split
         try:
-            # Remove timezone indicator
-            text = text.rstrip('Z')
-            
-            # Split into date and time
-            if 'T' in text:
-                date_str, time_str = text.split('T')
-            else:
-                date_str, time_str = text.split(' ')
-            
-            # Validate date
-            year, month, day = map(int, date_str.split('-'))
-            if not cls._validate_date(year, month, day):
-                return False
-                
-            # Validate time if present
-            if time_str:
-                time_parts = time_str.split(':')
-                hour = int(time_parts[0])
-                minute = int(time_parts[1])
-                second = float(time_parts[2])
-                if not cls._validate_time(hour, minute, second):
-                    return False
-                    
-            return True
-            
-        except (ValueError, IndexError):
-            return False
\ No newline at end of file
+            value = datetime.fromisoformat(text.rstrip('Z').split('.', 1)[0])
+        except ValueError:
+            return False
+        return 1900 <= value.year <= 2100
+
+
+# Validation and conversion are pure functions of the input string and the
+# same field values are re-checked on every keystroke and validation pass
+@lru_cache(maxsize=1024)
+def _validate_cached(text: str) -> bool:
+    return DateTimeValidator._validate(text)
+
+@lru_cache(maxsize=1024)
+def _convert_cached(text: str) -> Optional[str]:
+    return DateTimeValidator._convert(text)
@@ -2,6 +2,7 @@
 from xml.etree import ElementTree as ET
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+import logging
 
 @dataclass
 class StreamData:
@@ -97,35 +98,44 @@ class InventoryModel:
     
     def __init__(self, xml_handler):
         self.xml_handler = xml_handler
+        self.logger = logging.getLogger('InventoryModel')
         self.sensor_map = {}  # serial -> element
         self.datalogger_map = {}  # serial -> element
         self.ns = {'sc3': 'http://geofon.gfz-potsdam.de/ns/seiscomp3-schema/0.12'}
+        self.revision = 0  # Bumped on load and on every update, for cache invalidation
+        self._data_cache: Dict[int, Tuple[int, object]] = {}  # id(element) -> (revision, data)
+        self.device_revision = 0  # Bumped on load and on sensor/datalogger updates only
+        self._label_cache: Dict[str, Tuple[int, List[Tuple[str, str, str]]]] = {}  # tag -> (device_revision, labels)
 
         
     def load_inventory(self) -> None:
         """Load sensor and datalogger mappings"""
-        print("\n=== Loading Inventory Debug ===")
-        print("Loading sensors and dataloggers...")
-        print("=======================\n")
+        self.revision += 1
+        self.device_revision += 1
+        self._data_cache.clear()
+        self._label_cache.clear()
         self.sensor_map.clear()
         self.datalogger_map.clear()
-        # Debug sensor mapping
         for sensor in self.get_sensors():
             serial = self.xml_handler.get_element_text(sensor, 'serialNumber')
             name = sensor.get('name', '')
-            print(f"Found sensor - Name: {name}, Serial: {serial}")
+            self.logger.debug("Found sensor - Name: %s, Serial: %s", name, serial)
             if serial:
                 self.sensor_map[serial] = sensor
         
-        # Debug datalogger mapping
         for datalogger in self.get_dataloggers():
             serial = self.xml_handler.get_element_text(datalogger, 'serialNumber')
             name = datalogger.get('name', '')
-            print(f"Found datalogger - Name: {name}, Serial: {serial}")
+            self.logger.debug("Found datalogger - Name: %s, Serial: %s", name, serial)
             if serial:
                 self.datalogger_map[serial] = datalogger
-                
-        print("=======================\n")
+
+    def _get_cached_data(self, element: ET.Element):
+        """Return data extracted from element at the current revision, if any"""
+        cached = self._data_cache.get(id(element))
+        if cached is not None and cached[0] == self.revision:
+            return cached[1]
+        return None
 
     def get_location_data(self, element: ET.Element) -> LocationData:
         """Extract location data from element"""
@@ -164,6 +174,7 @@ class InventoryModel:
             if self.xml_handler.update_element_text(element, field, value):
                 updated = True
         
+        self.revision += 1
         return updated
 
 
@@ -179,6 +190,36 @@ class InventoryModel:
             return []
         return self.xml_handler.get_dataloggers()
     
+    def get_sensor_labels(self) -> List[Tuple[str, str, str]]:
+        """Get (name, manufacturer, model) for every named sensor"""
+        return self._get_device_labels('sensor', self.get_sensors)
+    
+    def get_datalogger_labels(self) -> List[Tuple[str, str, str]]:
+        """Get (name, manufacturer, model) for every named datalogger"""
+        return self._get_device_labels('datalogger', self.get_dataloggers)
+    
+    def _get_device_labels(self, tag: str, get_elements) -> List[Tuple[str, str, str]]:
+        """Extract labels in one pass over the elements, reusing them until a device changes"""
+        cached = self._label_cache.get(tag)
+        if cached is not None and cached[0] == self.device_revision:
+            return cached[1]
+            
+        uri = self.xml_handler.ns['sc3']
+        manufacturer_tag = f'{{{uri}}}manufacturer'
+        model_tag = f'{{{uri}}}model'
+        labels = []
+        for element in get_elements():
+            name = element.get('name', '')
+            if not name:
+                continue
+            texts = {child.tag: child.text for child in element}
+            labels.append((name,
+                           texts.get(manufacturer_tag) or '',
+                           texts.get(model_tag) or ''))
+        
+        self._label_cache[tag] = (self.device_revision, labels)
+        return labels
+    
     def get_all_streams(self) -> List[ET.Element]:
         """Get all stream elements from the inventory"""
         if not self.xml_handler.root:
@@ -187,15 +228,12 @@ class InventoryModel:
 
     def get_stream_data(self, element: ET.Element) -> StreamData:
         """Extract stream data from element"""
-        print("\n=== Stream Data Debug ===")
-        
         # Get serial numbers
         sensor_serial = self.xml_handler.get_element_text(element, 'sensorSerialNumber')
         datalogger_serial = self.xml_handler.get_element_text(element, 'dataloggerSerialNumber')
         
-        print(f"Found serials in stream:")
-        print(f"- Sensor: {sensor_serial}")
-        print(f"- Datalogger: {datalogger_serial}")
+        self.logger.debug("Found serials in stream - Sensor: %s, Datalogger: %s",
+                          sensor_serial, datalogger_serial)
         
         return StreamData(
             code=element.get('code', ''),
@@ -224,40 +262,31 @@ class InventoryModel:
 
 
     def update_stream(self, element: ET.Element, data: Dict[str, str]) -> bool:
-        """Update stream element with data"""
-        if data['code']:
+        """Update stream element with data (fields missing from data are left unchanged)"""
+        if data.get('code'):
             element.set('code', data['code'])
         
         updated = False
-        fields = {
-            'start': data['start'],
-            'end': data['end'],
-            'depth': data['depth'],
-            'azimuth': data['azimuth'],
-            'dip': data['dip'],
-            'gain': data['gain'],
-            'sampleRateNumerator': data['sampleRateNumerator'],
-            'sampleRateDenominator': data['sampleRateDenominator'],
-            'gainFrequency': data['gainFrequency'],
-            'gainUnit': data['gainUnit'],
-            'flags': data['flags'],
-            'sensorSerialNumber': data['sensorSerialNumber'],
-            'dataloggerSerialNumber': data['dataloggerSerialNumber']
-        }
+        fields = ('start', 'end', 'depth', 'azimuth', 'dip', 'gain',
+                  'sampleRateNumerator', 'sampleRateDenominator', 'gainFrequency',
+                  'gainUnit', 'flags', 'sensorSerialNumber', 'dataloggerSerialNumber')
         
-        for field, value in fields.items():
-            if self.xml_handler.update_element_text(element, field, value):
+        for field in fields:
+            if field in data and self.xml_handler.update_element_text(element, field, data[field]):
                 updated = True
         
+        self.revision += 1
         return updated
     
     def get_sensor_data(self, element: ET.Element) -> SensorData:
-        """Extract sensor data from element"""
-        print("\n=== Getting Sensor Data ===")
-        
+        """Extract sensor data from element, reusing it until the next update"""
+        cached = self._get_cached_data(element)
+        if cached is not None:
+            return cached
+            
         # First try to get the serial directly
         serial = self.xml_handler.get_element_text(element, 'serialNumber')
-        print(f"Direct serial number: {serial}")
+        self.logger.debug("Direct serial number: %s", serial)
         
         # If no serial found, try to find the parent stream's serial
         if not serial:
@@ -266,13 +295,13 @@ class InventoryModel:
             while parent is not None:
                 if parent.tag.endswith('stream'):
                     serial = self.xml_handler.get_element_text(parent, 'sensorSerialNumber')
-                    print(f"Found serial from parent stream: {serial}")
+                    self.logger.debug("Found serial from parent stream: %s", serial)
                     break
                 parent = parent.getparent() if hasattr(parent, 'getparent') else None
         
-        print(f"Final sensor serial number: {serial}")
+        self.logger.debug("Final sensor serial number: %s", serial)
         
-        return SensorData(
+        data = SensorData(
             name=element.get('name', ''),
             type=self.xml_handler.get_element_text(element, 'type'),
             model=self.xml_handler.get_element_text(element, 'model'),
@@ -285,6 +314,8 @@ class InventoryModel:
             calibrationDate=self.xml_handler.get_element_text(element, 'calibrationDate'),
             calibrationScale=self.xml_handler.get_element_text(element, 'calibrationScale')
         )
+        self._data_cache[id(element)] = (self.revision, data)
+        return data
 
    
     def update_sensor(self, element: ET.Element, data: Dict[str, str]) -> bool:
@@ -314,15 +345,15 @@ class InventoryModel:
         if data['serialNumber']:
             self.sensor_map[data['serialNumber']] = element
         
+        self.revision += 1
+        self.device_revision += 1
         return updated
     
     def get_datalogger_data(self, element: ET.Element) -> DataloggerData:
         """Extract datalogger data from element"""
-        print("\n=== Getting Datalogger Data ===")
-        
         # First try to get the serial directly
         serial = self.xml_handler.get_element_text(element, 'serialNumber')
-        print(f"Direct serial number: {serial}")
+        self.logger.debug("Direct serial number: %s", serial)
         
         # If no serial found, try to find the parent stream's serial
         if not serial:
@@ -331,11 +362,11 @@ class InventoryModel:
             while parent is not None:
                 if parent.tag.endswith('stream'):
                     serial = self.xml_handler.get_element_text(parent, 'dataloggerSerialNumber')
-                    print(f"Found serial from parent stream: {serial}")
+                    self.logger.debug("Found serial from parent stream: %s", serial)
                     break
                 parent = parent.getparent() if hasattr(parent, 'getparent') else None
         
-        print(f"Final datalogger serial number: {serial}")
+        self.logger.debug("Final datalogger serial number: %s", serial)
         
         return DataloggerData(
             name=element.get('name', ''),
@@ -377,11 +408,17 @@ class InventoryModel:
         if data['serialNumber']:
             self.datalogger_map[data['serialNumber']] = element
         
+        self.revision += 1
+        self.device_revision += 1
         return updated
     
     def get_network_data(self, element: ET.Element) -> NetworkData:
-        """Extract network data from element"""
-        return NetworkData(
+        """Extract network data from element, reusing it until the next update"""
+        cached = self._get_cached_data(element)
+        if cached is not None:
+            return cached
+            
+        data = NetworkData(
             code=element.get('code', ''),
             start=self.xml_handler.get_element_text(element, 'start'),
             end=self.xml_handler.get_element_text(element, 'end'),
@@ -394,35 +431,32 @@ class InventoryModel:
             restricted=self.xml_handler.get_element_text(element, 'restricted'),
             shared=self.xml_handler.get_element_text(element, 'shared')
         )
+        self._data_cache[id(element)] = (self.revision, data)
+        return data
     
     def update_network(self, element: ET.Element, data: Dict[str, str]) -> bool:
-        """Update network element with data"""
-        if data['code']:
+        """Update network element with data (fields missing from data are left unchanged)"""
+        if data.get('code'):
             element.set('code', data['code'])
         
         updated = False
-        fields = {
-            'start': data['start'],
-            'end': data['end'],
-            'description': data['description'],
-            'institutions': data['institutions'],
-            'region': data['region'],
-            'type': data['type'],
-            'netClass': data['netClass'],
-            'archive': data['archive'],
-            'restricted': data['restricted'],
-            'shared': data['shared']
-        }
+        fields = ('start', 'end', 'description', 'institutions', 'region',
+                  'type', 'netClass', 'archive', 'restricted', 'shared')
         
-        for field, value in fields.items():
-            if self.xml_handler.update_element_text(element, field, value):
+        for field in fields:
+            if field in data and self.xml_handler.update_element_text(element, field, data[field]):
                 updated = True
         
+        self.revision += 1
         return updated
     
     def get_station_data(self, element: ET.Element) -> StationData:
-        """Extract station data from element"""
-        return StationData(
+        """Extract station data from element, reusing it until the next update"""
+        cached = self._get_cached_data(element)
+        if cached is not None:
+            return cached
+            
+        data = StationData(
             code=element.get('code', ''),
             name=element.get('name', ''),
             description=self.xml_handler.get_element_text(element, 'description'),
@@ -436,6 +470,8 @@ class InventoryModel:
             country=self.xml_handler.get_element_text(element, 'country'),
             affiliation=self.xml_handler.get_element_text(element, 'affiliation')
         )
+        self._data_cache[id(element)] = (self.revision, data)
+        return data
     
     def update_station(self, element: ET.Element, data: Dict[str, str]) -> bool:
         """Update station element with data"""
@@ -463,4 +499,5 @@ class InventoryModel:
             if self.xml_handler.update_element_text(element, field, value):
                 updated = True
         
+        self.revision += 1
         return updated
\ No newline at end of file
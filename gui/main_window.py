@@ -102,6 +102,7 @@ class MainWindow(QMainWindow):
         self.load_button.clicked.connect(self.load_xml)
         self.save_button.clicked.connect(self.save_xml)
         self.tree_widget.elementSelected.connect(self.handle_element_selection)
+        self.tree_widget.elementActivated.connect(self.handle_element_selection)
 
         # Create menu bar
         self.create_menu_bar()
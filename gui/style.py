@@ -0,0 +1,51 @@
+# gui/style.py
+from PyQt5.QtGui import QPalette, QColor
+
+# Application-wide widget styles. Widgets opt in via a 'class' property,
+# e.g. button.setProperty('class', 'primary'), so the sheet is parsed once
+# instead of once per widget
+APP_QSS = """
+    QPushButton[class="primary"] {
+        background-color: #4CAF50;
+        color: white;
+        padding: 8px 16px;
+        border: none;
+        border-radius: 4px;
+    }
+    QPushButton[class="primary"]:hover {
+        background-color: #45a049;
+    }
+    QPushButton[class="primary"]:disabled {
+        background-color: #cccccc;
+    }
+"""
+
+# Application palette as (role, RGB) pairs; QColor/QPalette objects are only
+# built in setup_application_style, once the application exists
+PALETTE_COLORS = (
+    (QPalette.Window, (240, 240, 240)),
+    (QPalette.WindowText, (0, 0, 0)),
+    (QPalette.Base, (255, 255, 255)),
+    (QPalette.AlternateBase, (245, 245, 245)),
+    (QPalette.ToolTipBase, (255, 255, 255)),
+    (QPalette.ToolTipText, (0, 0, 0)),
+    (QPalette.Text, (0, 0, 0)),
+    (QPalette.Button, (240, 240, 240)),
+    (QPalette.ButtonText, (0, 0, 0)),
+    (QPalette.Link, (0, 120, 210)),
+    (QPalette.Highlight, (42, 130, 218)),
+    (QPalette.HighlightedText, (255, 255, 255)),
+)
+
+def setup_application_style(app):
+    """Setup application-wide style and theme"""
+    # Use Fusion style for a modern look
+    app.setStyle('Fusion')
+    
+    # Setup color palette
+    palette = QPalette()
+    for role, rgb in PALETTE_COLORS:
+        palette.setColor(role, QColor(*rgb))
+    
+    app.setPalette(palette)
+    app.setStyleSheet(APP_QSS)
@@ -1,9 +1,12 @@
 # gui/tabs/datalogger_tab.py
 from PyQt5.QtWidgets import (QWidget, QFormLayout, QGroupBox, QPushButton, 
-                           QVBoxLayout, QLabel, QLineEdit, QComboBox)
+                           QVBoxLayout, QLineEdit, QComboBox)
 from PyQt5.QtCore import pyqtSignal
-from gui.widgets.validation import ValidationLineEdit
+from gui.widgets.validation import ValidationLineEdit, is_nonneg_decimal
+from gui.widgets.status_label import StatusLabel
+from gui.widgets.form_rows import add_form_rows
 from typing import Optional, Dict
+import logging
 from xml.etree import ElementTree as ET
 from core.datetime_validation import DateTimeValidator
 
@@ -13,17 +16,18 @@ class DataloggerTab(QWidget):
     dataloggerUpdated = pyqtSignal()  # Signal when datalogger is updated
     
     # Common datalogger types for dropdown
-    DATALOGGER_TYPES = [
+    DATALOGGER_TYPES = (
         "Analog",
         "Digital",
         "Hybrid",
         "Other"
-    ]
+    )
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_element = None
         self.inventory_model = None
+        self.logger = logging.getLogger('DataloggerTab')
         self.setup_ui()
 
     def validate_datetime(self, text: str) -> bool:
@@ -42,13 +46,13 @@ class DataloggerTab(QWidget):
         self.datalogger_name = ValidationLineEdit(required=True, parent=self)
         self.datalogger_type = QComboBox(self)
         self.datalogger_type.setEditable(True)
-        self.datalogger_type.addItems(self.DATALOGGER_TYPES)
+        self.datalogger_type.insertItems(0, self.DATALOGGER_TYPES)
         self.datalogger_type.setCurrentText("")
         
         self.datalogger_model = ValidationLineEdit(parent=self)
         self.datalogger_manufacturer = ValidationLineEdit(parent=self)
         self.datalogger_serial = ValidationLineEdit(
-            validator=lambda x: bool(x.strip()),  # Strip whitespace
+            validator='required',
             required=True,
             parent=self)
         
@@ -59,83 +63,59 @@ class DataloggerTab(QWidget):
         sampling_layout = QFormLayout()
         
         self.max_clock_drift = ValidationLineEdit(
-            validator=lambda x: x.replace('.', '', 1).isdigit() if x else True,
+            validator=is_nonneg_decimal,
             parent=self
         )
         self.record_length = ValidationLineEdit(
-            validator=lambda x: x.isdigit() if x else True,
+            validator='digits',
             parent=self
         )
         self.sample_rate = ValidationLineEdit(
-            validator=lambda x: x.replace('.', '', 1).isdigit() if x else True,
+            validator=is_nonneg_decimal,
             parent=self
         )
         self.sample_rate_multiplier = ValidationLineEdit(
-            validator=lambda x: x.isdigit() if x else True,
+            validator='digits',
             parent=self
         )
         
-        # Add tooltips
-        self.datalogger_name.setToolTip("Datalogger name (required)")
-        self.datalogger_type.setToolTip("Type of datalogger")
-        self.datalogger_model.setToolTip("Datalogger model number/name")
-        self.datalogger_manufacturer.setToolTip("Manufacturer name")
-        self.datalogger_serial.setToolTip("Serial number (required)")
+        # Handle serial number edits
         self.datalogger_serial.editingFinished.connect(self.handle_editing_finished)
-        self.datalogger_description.setToolTip("Additional description")
-        self.max_clock_drift.setToolTip("Maximum clock drift in seconds per day")
-        self.record_length.setToolTip("Record length in samples")
-        self.sample_rate.setToolTip("Sample rate in Hz")
-        self.sample_rate_multiplier.setToolTip("Sample rate multiplier")
         
         # Add fields to main layout
-        datalogger_layout.addRow("Name:", self.datalogger_name)
-        datalogger_layout.addRow("Type:", self.datalogger_type)
-        datalogger_layout.addRow("Model:", self.datalogger_model)
-        datalogger_layout.addRow("Manufacturer:", self.datalogger_manufacturer)
-        datalogger_layout.addRow("Serial Number:", self.datalogger_serial)
-        datalogger_layout.addRow("Description:", self.datalogger_description)
+        rows = (
+            ("Name:", self.datalogger_name, "Datalogger name (required)"),
+            ("Type:", self.datalogger_type, "Type of datalogger"),
+            ("Model:", self.datalogger_model, "Datalogger model number/name"),
+            ("Manufacturer:", self.datalogger_manufacturer, "Manufacturer name"),
+            ("Serial Number:", self.datalogger_serial, "Serial number (required)"),
+            ("Description:", self.datalogger_description, "Additional description"),
+        )
+        add_form_rows(datalogger_layout, rows)
         
         datalogger_group.setLayout(datalogger_layout)
         layout.addWidget(datalogger_group)
         
         # Add fields to sampling layout
-        sampling_layout.addRow("Max Clock Drift (s/day):", self.max_clock_drift)
-        sampling_layout.addRow("Record Length (samples):", self.record_length)
-        sampling_layout.addRow("Sample Rate (Hz):", self.sample_rate)
-        sampling_layout.addRow("Sample Rate Multiplier:", self.sample_rate_multiplier)
+        sampling_rows = (
+            ("Max Clock Drift (s/day):", self.max_clock_drift, "Maximum clock drift in seconds per day"),
+            ("Record Length (samples):", self.record_length, "Record length in samples"),
+            ("Sample Rate (Hz):", self.sample_rate, "Sample rate in Hz"),
+            ("Sample Rate Multiplier:", self.sample_rate_multiplier, "Sample rate multiplier"),
+        )
+        add_form_rows(sampling_layout, sampling_rows)
         
         sampling_group.setLayout(sampling_layout)
         layout.addWidget(sampling_group)
         
         # Add update button
         self.update_button = QPushButton("Update Datalogger")
-        self.update_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.update_button.setProperty('class', 'primary')  # Styled by the application sheet
         self.update_button.clicked.connect(self.update_datalogger)
         layout.addWidget(self.update_button)
         
         # Add status label
-        self.status_label = QLabel()
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #666;
-                padding: 5px;
-            }
-        """)
+        self.status_label = StatusLabel()
         layout.addWidget(self.status_label)
         
     def set_inventory_model(self, model):
@@ -144,8 +124,7 @@ class DataloggerTab(QWidget):
         
     def set_current_element(self, element: Optional[ET.Element]):
         """Set current datalogger element and populate fields"""
-        print("\n=== Datalogger Tab Debug ===")
-        print(f"Setting datalogger element: {element is not None}")
+        self.logger.debug("Setting datalogger element: %s", element is not None)
 
         self.current_element = element
         if element is None:
@@ -153,10 +132,8 @@ class DataloggerTab(QWidget):
             
         # Get datalogger data
         data = self.inventory_model.get_datalogger_data(element)
-        print(f"Datalogger data loaded:")
-        print(f"- Name: {data.name}")
-        print(f"- Serial Number: {data.serialNumber}")  # Debug serial number
-        print(f"- Model: {data.model}")
+        self.logger.debug("Datalogger data loaded - Name: %s, Serial Number: %s, Model: %s",
+                          data.name, data.serialNumber, data.model)
         
         # Populate fields
         self.datalogger_name.setText(data.name)
@@ -238,23 +215,19 @@ class DataloggerTab(QWidget):
             return
             
         if not self.validate_all():
-            self.status_label.setText("Please correct the invalid fields")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+            self.status_label.set_status("Please correct the invalid fields", StatusLabel.ERROR)
             return
             
         try:
             data = self.get_current_data()
             if self.inventory_model.update_datalogger(self.current_element, data):
-                self.status_label.setText("Datalogger updated successfully")
-                self.status_label.setStyleSheet("QLabel { color: #5cb85c; }")
+                self.status_label.set_status("Datalogger updated successfully", StatusLabel.OK)
                 self.dataloggerUpdated.emit()
             else:
-                self.status_label.setText("No changes to update")
-                self.status_label.setStyleSheet("QLabel { color: #666; }")
+                self.status_label.set_status("No changes to update", StatusLabel.INFO)
                 
         except Exception as e:
-            self.status_label.setText(f"Error updating datalogger: {str(e)}")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+            self.status_label.set_status(f"Error updating datalogger: {str(e)}", StatusLabel.ERROR)
             
     def handle_editing_finished(self):
         """Called when editing is finished in any field"""
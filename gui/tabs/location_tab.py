@@ -1,11 +1,12 @@
 # gui/tabs/location_tab.py
 
 from PyQt5.QtWidgets import (QWidget, QFormLayout, QGroupBox, QPushButton, 
-                           QVBoxLayout, QLabel)
-from PyQt5.QtCore import pyqtSignal
-from gui.widgets.validation import ValidationLineEdit
+                           QVBoxLayout)
+from PyQt5.QtCore import pyqtSignal, QTimer, QSignalBlocker
+from gui.widgets.validation import ValidationLineEdit, VKind, decimal_in_range, parse_signed_decimal
+from gui.widgets.status_label import StatusLabel
+from gui.widgets.form_rows import add_form_rows
 from core.datetime_validation import DateTimeValidator
-import re
 from typing import Optional, Dict
 from xml.etree import ElementTree as ET
 
@@ -31,38 +32,38 @@ class LocationTab(QWidget):
         # Create input fields with validation
         # Code validation should check for non-empty and alphanumeric
         self.location_code = ValidationLineEdit(
-            validator=lambda x: bool(re.match(r'^[A-Za-z0-9]*$', x)),  # Note the * instead of + to allow empty
+            validator=VKind.ALNUM,
             required=False,  # Changed to False since it's not always required
             parent=self
         )
         
         # Use DateTimeValidator for start/end times
         self.location_start = ValidationLineEdit(
-            validator=lambda x: DateTimeValidator.validate(x),
+            validator=VKind.DATETIME,
             parent=self
         )
         self.location_end = ValidationLineEdit(
-            validator=lambda x: DateTimeValidator.validate(x),
+            validator=VKind.DATETIME,
             parent=self
         )
         
         # Coordinate validation
         self.location_lat = ValidationLineEdit(
-            validator=lambda x: bool(re.match(r'^-?\d*\.?\d*$', x)) and -90 <= float(x) <= 90 if x else True,
+            validator=VKind.LAT,
             parent=self
         )
         self.location_lon = ValidationLineEdit(
-            validator=lambda x: bool(re.match(r'^-?\d*\.?\d*$', x)) and -180 <= float(x) <= 180 if x else True,
+            validator=VKind.LON,
             parent=self
         )
         
         # Numeric validation for elevation and depth
         self.location_elevation = ValidationLineEdit(
-            validator=lambda x: bool(re.match(r'^-?\d*\.?\d*$', x)) if x else True,
+            validator=VKind.DECIMAL,
             parent=self
         )
         self.location_depth = ValidationLineEdit(
-            validator=lambda x: bool(re.match(r'^-?\d*\.?\d*$', x)) if x else True,
+            validator=VKind.DECIMAL,
             parent=self
         )
         
@@ -71,65 +72,58 @@ class LocationTab(QWidget):
         self.location_description = ValidationLineEdit(parent=self)
         self.location_affiliation = ValidationLineEdit(parent=self)
         
-        # Add tooltips with validation requirements
-        self.location_code.setToolTip("Location code (required, alphanumeric only)")
-        self.location_start.setToolTip("Start date/time (YYYY-MM-DD HH:MM:SS)")
-        self.location_end.setToolTip("End date/time (YYYY-MM-DD HH:MM:SS)")
-        self.location_lat.setToolTip("Latitude in decimal degrees (-90 to 90)")
-        self.location_lon.setToolTip("Longitude in decimal degrees (-180 to 180)")
-        self.location_elevation.setToolTip("Elevation in meters above sea level")
+        # Data key -> widget, shared by get/set/clear
+        self._fields = (
+            ('code', self.location_code),
+            ('start', self.location_start),
+            ('end', self.location_end),
+            ('latitude', self.location_lat),
+            ('longitude', self.location_lon),
+            ('elevation', self.location_elevation),
+            ('depth', self.location_depth),
+            ('country', self.location_country),
+            ('description', self.location_description),
+            ('affiliation', self.location_affiliation),
+        )
         
-        # Add fields to layout
-        location_layout.addRow("Code*:", self.location_code)
-        location_layout.addRow("Start Time:", self.location_start)
-        location_layout.addRow("End Time:", self.location_end)
-        location_layout.addRow("Latitude (°):", self.location_lat)
-        location_layout.addRow("Longitude (°):", self.location_lon)
-        location_layout.addRow("Elevation (m):", self.location_elevation)
-        location_layout.addRow("Country:", self.location_country)
-        location_layout.addRow("Description:", self.location_description)
-        location_layout.addRow("Affiliation:", self.location_affiliation)
+        # Add fields to layout with tooltips describing validation requirements
+        rows = (
+            ("Code*:", self.location_code, "Location code (required, alphanumeric only)"),
+            ("Start Time:", self.location_start, "Start date/time (YYYY-MM-DD HH:MM:SS)"),
+            ("End Time:", self.location_end, "End date/time (YYYY-MM-DD HH:MM:SS)"),
+            ("Latitude (°):", self.location_lat, "Latitude in decimal degrees (-90 to 90)"),
+            ("Longitude (°):", self.location_lon, "Longitude in decimal degrees (-180 to 180)"),
+            ("Elevation (m):", self.location_elevation, "Elevation in meters above sea level"),
+            ("Country:", self.location_country, None),
+            ("Description:", self.location_description, None),
+            ("Affiliation:", self.location_affiliation, None),
+        )
+        add_form_rows(location_layout, rows)
         
         location_group.setLayout(location_layout)
         layout.addWidget(location_group)
         
         # Add update button
         self.update_button = QPushButton("Update Location")
-        self.update_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.update_button.setProperty('class', 'primary')  # Styled by the application sheet
         self.update_button.clicked.connect(self.update_location)
         layout.addWidget(self.update_button)
         
         # Add status label
-        self.status_label = QLabel()
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #666;
-                padding: 5px;
-            }
-        """)
+        self.status_label = StatusLabel()
         layout.addWidget(self.status_label)
         
+        # Coalesce bursts of editingFinished (e.g. tabbing through fields)
+        # into a single validation pass
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(50)
+        self._validate_timer.timeout.connect(self.validate_all)
+        
         # Connect editing finished signals
-        self.location_code.editingFinished.connect(self.handle_editing_finished)
-        self.location_start.editingFinished.connect(self.handle_editing_finished)
-        self.location_end.editingFinished.connect(self.handle_editing_finished)
-        self.location_lat.editingFinished.connect(self.handle_editing_finished)
-        self.location_lon.editingFinished.connect(self.handle_editing_finished)
-        self.location_elevation.editingFinished.connect(self.handle_editing_finished)
+        for field in (self.location_code, self.location_start, self.location_end,
+                      self.location_lat, self.location_lon, self.location_elevation):
+            field.editingFinished.connect(self.handle_editing_finished)
     
     def set_inventory_model(self, model):
         """Set the inventory model reference"""
@@ -144,33 +138,20 @@ class LocationTab(QWidget):
         # Get location data
         data = self.inventory_model.get_location_data(element)
         
-        # Populate fields
-        self.location_code.setText(data.code)
-        self.location_start.setText(data.start)
-        self.location_end.setText(data.end)
-        self.location_lat.setText(data.latitude)
-        self.location_lon.setText(data.longitude)
-        self.location_elevation.setText(data.elevation)
-        self.location_country.setText(data.country)
-        self.location_description.setText(data.description)
-        self.location_affiliation.setText(data.affiliation)
+        # Populate fields without per-field textChanged validation
+        for key, field in self._fields:
+            with QSignalBlocker(field):
+                field.setText(getattr(data, key))
         
-        self.status_label.setText("")
+        # Refresh field styling, then validate the form once
+        for _, field in self._fields:
+            field.validate()
+        if self.validate_all():
+            self.status_label.setText("")
         
     def get_current_data(self) -> Dict[str, str]:
         """Get current field values"""
-        data = {
-            'code': self.location_code.text().strip(),
-            'start': self.location_start.text().strip(),
-            'end': self.location_end.text().strip(),
-            'latitude': self.location_lat.text().strip(),
-            'longitude': self.location_lon.text().strip(),
-            'elevation': self.location_elevation.text().strip(),
-            'depth': self.location_depth.text().strip(),
-            'country': self.location_country.text().strip(),
-            'description': self.location_description.text().strip(),
-            'affiliation': self.location_affiliation.text().strip()
-        }
+        data = {key: field.text().strip() for key, field in self._fields}
         
         # Convert datetime formats if needed
         if data['start']:
@@ -182,82 +163,54 @@ class LocationTab(QWidget):
         
     def validate_coordinates(self) -> bool:
         """Validate latitude and longitude"""
-        try:
-            if self.location_lat.text():
-                lat = float(self.location_lat.text())
-                if not -90 <= lat <= 90:
-                    return False
-                    
-            if self.location_lon.text():
-                lon = float(self.location_lon.text())
-                if not -180 <= lon <= 180:
-                    return False
-                    
-            return True
+        lat = self.location_lat.text()
+        if lat and not decimal_in_range(lat, -90, 90):
+            return False
             
-        except ValueError:
+        lon = self.location_lon.text()
+        if lon and not decimal_in_range(lon, -180, 180):
             return False
             
+        return True
+            
     def validate_elevation(self) -> bool:
         """Validate elevation and depth"""
-        try:
-            if self.location_elevation.text():
-                float(self.location_elevation.text())
-                
-            if self.location_depth.text():
-                float(self.location_depth.text())
-                
-            return True
+        elevation = self.location_elevation.text()
+        if elevation and parse_signed_decimal(elevation) is None:
+            return False
             
-        except ValueError:
+        depth = self.location_depth.text()
+        if depth and parse_signed_decimal(depth) is None:
             return False
+            
+        return True
 
     def validate_all(self) -> bool:
-        """Validate all input fields"""
-        validations = []
-        
+        """Validate all input fields, stopping at the first failure"""
         # Check code field - only validate if not empty
-        if self.location_code.text().strip():
-            code_valid = self.location_code.validate()
-            if not code_valid:
-                self.status_label.setText("Location code must be alphanumeric")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                validations.append(False)
-
+        if self.location_code.text().strip() and not self.location_code.validate():
+            self.status_label.set_status("Location code must be alphanumeric", StatusLabel.ERROR)
+            return False
         
         # Validate dates
-        if self.location_start.text():
-            start_valid = DateTimeValidator.validate(self.location_start.text())
-            if not start_valid:
-                self.status_label.setText("Invalid start time format")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                validations.append(False)
+        start = self.location_start.text()
+        if start and not DateTimeValidator.validate(start):
+            self.status_label.set_status("Invalid start time format", StatusLabel.ERROR)
+            return False
         
-        if self.location_end.text():
-            end_valid = DateTimeValidator.validate(self.location_end.text())
-            if not end_valid:
-                self.status_label.setText("Invalid end time format")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                validations.append(False)
+        end = self.location_end.text()
+        if end and not DateTimeValidator.validate(end):
+            self.status_label.set_status("Invalid end time format", StatusLabel.ERROR)
+            return False
         
         # Validate coordinates if provided
-        if self.location_lat.text() or self.location_lon.text():
-            coord_valid = self.validate_coordinates()
-            if not coord_valid:
-                self.status_label.setText("Invalid coordinates")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                validations.append(False)
+        if not self.validate_coordinates():
+            self.status_label.set_status("Invalid coordinates", StatusLabel.ERROR)
+            return False
         
         # Validate numeric fields if provided
-        if self.location_elevation.text() or self.location_depth.text():
-            numeric_valid = self.validate_elevation()
-            if not numeric_valid:
-                self.status_label.setText("Invalid elevation or depth values")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                validations.append(False)
-        
-        # If any validation failed, return False
-        if False in validations:
+        if not self.validate_elevation():
+            self.status_label.set_status("Invalid elevation or depth values", StatusLabel.ERROR)
             return False
         
         return True
@@ -268,23 +221,19 @@ class LocationTab(QWidget):
             return
             
         if not self.validate_all():
-            self.status_label.setText("Please correct the invalid fields")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+            self.status_label.set_status("Please correct the invalid fields", StatusLabel.ERROR)
             return
             
         try:
             data = self.get_current_data()
             if self.inventory_model.update_location(self.current_element, data):
-                self.status_label.setText("Location updated successfully")
-                self.status_label.setStyleSheet("QLabel { color: #5cb85c; }")
+                self.status_label.set_status("Location updated successfully", StatusLabel.OK)
                 self.locationUpdated.emit()
             else:
-                self.status_label.setText("No changes to update")
-                self.status_label.setStyleSheet("QLabel { color: #666; }")
+                self.status_label.set_status("No changes to update", StatusLabel.INFO)
                 
         except Exception as e:
-            self.status_label.setText(f"Error updating location: {str(e)}")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+            self.status_label.set_status(f"Error updating location: {str(e)}", StatusLabel.ERROR)
             
     def handle_editing_finished(self):
         """Called when editing is finished in any field"""
@@ -296,19 +245,12 @@ class LocationTab(QWidget):
                 if converted and converted != sender.text():
                     sender.setText(converted)
             
-            # Validate the field
-            self.validate_all()
+            # Validate once the user pauses
+            self._validate_timer.start()
+
 
     def clear_fields(self):
         """Clear all input fields"""
-        self.location_code.clear()
-        self.location_start.clear()
-        self.location_end.clear()
-        self.location_lat.clear()
-        self.location_lon.clear()
-        self.location_elevation.clear()
-        self.location_depth.clear()
-        self.location_country.clear()
-        self.location_description.clear()
-        self.location_affiliation.clear()
-        self.status_label.clear()
\ No newline at end of file
+        for _, field in self._fields:
+            field.clear()
+        self.status_label.clear()
@@ -1,17 +1,40 @@
 # gui/tabs/network_tab.py
 from PyQt5.QtWidgets import (QWidget, QFormLayout, QGroupBox, QPushButton, 
-                           QVBoxLayout, QLabel)
-from PyQt5.QtCore import pyqtSignal, QUrl
+                           QVBoxLayout)
+from PyQt5.QtCore import pyqtSignal, QUrl, QTimer
 from PyQt5.QtGui import QDesktopServices
 from gui.widgets.validation import ValidationLineEdit
+from gui.widgets.status_label import StatusLabel
+from gui.widgets.form_rows import add_form_rows
 import re
 from typing import Optional, Dict, List, Tuple
 from xml.etree import ElementTree as ET
-import folium
 import os
-import tempfile
+import weakref
+from dataclasses import dataclass, asdict
 from core.datetime_validation import DateTimeValidator
 
+# folium and numpy are imported on first use of the map, so normal
+# editing does not pay their import cost
+
+def _remove_map_file(path: str) -> None:
+    """Delete a temporary map file if it still exists"""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+@dataclass
+class NetworkStations:
+    """Stations with coordinates, stored as parallel columns"""
+    codes: List[str]
+    names: List[str]
+    lats: List[float]
+    lons: List[float]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
 class NetworkTab(QWidget):
     """Tab for editing network information"""
     
@@ -22,6 +45,15 @@ class NetworkTab(QWidget):
         self.current_element = None
         self.inventory_model = None
         self.map_file = None
+        self._snapshot: Dict[str, str] = {}  # Field values as loaded from the element
+        
+        # Coalesce editingFinished bursts (tabbing through fields) into one update
+        self._commit_timer = QTimer(self)
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(200)
+        self._commit_timer.timeout.connect(self.update_network)
+        # (id(network), model revision) -> stations with coordinates
+        self._stations_cache: Dict[Tuple[int, int], NetworkStations] = {}
         self.setup_ui()
         
     def setup_ui(self):
@@ -49,113 +81,93 @@ class NetworkTab(QWidget):
         self.network_netClass = ValidationLineEdit(parent=self)
         self.network_archive = ValidationLineEdit(parent=self)
         self.network_restricted = ValidationLineEdit(
-            validator=lambda x: x.lower() in ['true', 'false', ''],
+            validator='bool',
             parent=self
         )
         self.network_shared = ValidationLineEdit(
-            validator=lambda x: x.lower() in ['true', 'false', ''],
+            validator='bool',
             parent=self
         )
         
-        # Add tooltips
-        self.network_code.setToolTip("Network code (required)")
-        self.network_start.setToolTip("Start date/time (YYYY-MM-DD HH:MM:SS)")
-        self.network_end.setToolTip("End date/time (YYYY-MM-DD HH:MM:SS)")
-        self.network_restricted.setToolTip("Access restriction flag (true/false)")
-        self.network_shared.setToolTip("Shared resource flag (true/false)")
-        
         # Add fields to layout with labels
-        network_layout.addRow("Code:", self.network_code)
-        network_layout.addRow("Start Time:", self.network_start)
-        network_layout.addRow("End Time:", self.network_end)
-        network_layout.addRow("Description:", self.network_description)
-        network_layout.addRow("Institutions:", self.network_institutions)
-        network_layout.addRow("Region:", self.network_region)
-        network_layout.addRow("Type:", self.network_type)
-        network_layout.addRow("Network Class:", self.network_netClass)
-        network_layout.addRow("Archive:", self.network_archive)
-        network_layout.addRow("Restricted:", self.network_restricted)
-        network_layout.addRow("Shared:", self.network_shared)
+        rows = (
+            ("Code:", self.network_code, "Network code (required)"),
+            ("Start Time:", self.network_start, "Start date/time (YYYY-MM-DD HH:MM:SS)"),
+            ("End Time:", self.network_end, "End date/time (YYYY-MM-DD HH:MM:SS)"),
+            ("Description:", self.network_description, None),
+            ("Institutions:", self.network_institutions, None),
+            ("Region:", self.network_region, None),
+            ("Type:", self.network_type, None),
+            ("Network Class:", self.network_netClass, None),
+            ("Archive:", self.network_archive, None),
+            ("Restricted:", self.network_restricted, "Access restriction flag (true/false)"),
+            ("Shared:", self.network_shared, "Shared resource flag (true/false)"),
+        )
+        add_form_rows(network_layout, rows)
         
         network_group.setLayout(network_layout)
         layout.addWidget(network_group)
 
-        # Add map button
+        # Add map button, spaced off the form
+        layout.addSpacing(10)
         self.view_map_button = QPushButton("View Network Stations on Map")
-        self.view_map_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-                margin-top: 10px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.view_map_button.setProperty('class', 'primary')  # Styled by the application sheet
         self.view_map_button.clicked.connect(self.show_map)
         layout.addWidget(self.view_map_button)
         
         # Add update button
         self.update_button = QPushButton("Update Network")
-        self.update_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
-        self.update_button.clicked.connect(self.update_network)
+        self.update_button.setProperty('class', 'primary')  # Styled by the application sheet
+        self.update_button.clicked.connect(self.update_network_now)
         layout.addWidget(self.update_button)
         
         # Add status label
-        self.status_label = QLabel()
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #666;
-                padding: 5px;
-            }
-        """)
+        self.status_label = StatusLabel()
         layout.addWidget(self.status_label)
 
-    def get_network_stations(self) -> List[Tuple[str, str, float, float]]:
+    def get_network_stations(self) -> NetworkStations:
         """Get all stations in the current network"""
-        stations = []
-        if self.current_element and self.inventory_model:
-            for station in self.inventory_model.xml_handler.get_stations(self.current_element):
-                data = self.inventory_model.get_station_data(station)
-                if data.latitude and data.longitude:
-                    try:
-                        lat = float(data.latitude)
-                        lon = float(data.longitude)
-                        name = data.name or data.code
-                        stations.append((data.code, name, lat, lon))
-                    except ValueError:
-                        continue
+        if self.current_element is None or not self.inventory_model:
+            return NetworkStations([], [], [], [])
+            
+        key = (id(self.current_element), self.inventory_model.revision)
+        cached = self._stations_cache.get(key)
+        if cached is not None:
+            return cached
+            
+        codes, names, lats, lons = [], [], [], []
+        for station in self.inventory_model.xml_handler.get_stations(self.current_element):
+            data = self.inventory_model.get_station_data(station)
+            if data.latitude and data.longitude:
+                try:
+                    lat = float(data.latitude)
+                    lon = float(data.longitude)
+                except ValueError:
+                    continue
+                codes.append(data.code)
+                names.append(data.name or data.code)
+                lats.append(lat)
+                lons.append(lon)
+                
+        stations = NetworkStations(codes=codes, names=names, lats=lats, lons=lons)
+        self._stations_cache[key] = stations
         return stations
 
-    def create_map(self, stations: List[Tuple[str, str, float, float]]):
+    def create_map(self, stations: NetworkStations):
         """Create a map with all station markers"""
         try:
+            import folium
+            import numpy as np
+            
             if not stations:
                 return False
 
+            lats = np.asarray(stations.lats, dtype=np.float64)
+            lons = np.asarray(stations.lons, dtype=np.float64)
+
             # Calculate center point as average of all stations
-            center_lat = sum(s[2] for s in stations) / len(stations)
-            center_lon = sum(s[3] for s in stations) / len(stations)
+            center_lat = float(lats.mean())
+            center_lon = float(lons.mean())
 
             # Create map centered at the average position
             m = folium.Map(
@@ -165,36 +177,43 @@ class NetworkTab(QWidget):
                 attr='Google Maps'
             )
 
-            # Add markers for all stations
-            station_group = folium.FeatureGroup(name="Stations")
-            for code, name, lat, lon in stations:
-                folium.Marker(
-                    [lat, lon],
-                    popup=f"{code}: {name}",
-                    tooltip=code,
-                    icon=folium.Icon(color='red', icon='info-sign')
-                ).add_to(station_group)
-
-            station_group.add_to(m)
+            # Add all stations as a single GeoJSON layer so the map renders
+            # one template instead of one per marker
+            features = [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                    "properties": {"code": code, "name": name}
+                }
+                for code, name, lat, lon in zip(stations.codes, stations.names,
+                                                stations.lats, stations.lons)
+            ]
+            folium.GeoJson(
+                {"type": "FeatureCollection", "features": features},
+                name="Stations",
+                marker=folium.Marker(icon=folium.Icon(color='red', icon='info-sign')),
+                tooltip=folium.GeoJsonTooltip(fields=['code'], labels=False),
+                popup=folium.GeoJsonPopup(fields=['code', 'name'], labels=False)
+            ).add_to(m)
 
             # Add layer control
             folium.LayerControl().add_to(m)
 
             # Fit bounds to show all markers
             if len(stations) > 1:
-                bounds = [[s[2], s[3]] for s in stations]
-                m.fit_bounds(bounds)
-
-            # Save to temporary file
-            if self.map_file:
-                try:
-                    os.unlink(self.map_file)
-                except:
-                    pass
+                m.fit_bounds(np.column_stack((lats, lons)).tolist())
 
-            fd, self.map_file = tempfile.mkstemp(suffix='.html')
-            os.close(fd)
-            m.save(self.map_file)
+            # Save to a securely created temporary file, overwritten on each call
+            if not self.map_file:
+                import tempfile
+                fd, self.map_file = tempfile.mkstemp(prefix='seiscomp_net_', suffix='.html')
+                # Removed when the tab is collected or at interpreter exit
+                weakref.finalize(self, _remove_map_file, self.map_file)
+                outfile = os.fdopen(fd, 'wb')
+            else:
+                outfile = open(self.map_file, 'wb')
+            with outfile:
+                m.save(outfile)
 
             return True
         except Exception as e:
@@ -209,14 +228,12 @@ class NetworkTab(QWidget):
                 if self.create_map(stations):
                     QDesktopServices.openUrl(QUrl.fromLocalFile(self.map_file))
                 else:
-                    self.status_label.setText("Error creating map")
-                    self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+                    self.status_label.set_status("Error creating map", StatusLabel.ERROR)
             except Exception as e:
-                self.status_label.setText(f"Error showing map: {str(e)}")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+                self.status_label.set_status(f"Error showing map: {str(e)}", StatusLabel.ERROR)
         else:
-            self.status_label.setText("No stations with coordinates found")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+            self.status_label.set_status("No stations with coordinates found", StatusLabel.ERROR)
+
 
     def set_inventory_model(self, model):
         """Set the inventory model reference"""
@@ -224,7 +241,20 @@ class NetworkTab(QWidget):
         
     def set_current_element(self, element: Optional[ET.Element]):
         """Set current network element and populate fields"""
+        # Commit any pending edit to the element it was made on
+        if self._commit_timer.isActive():
+            self.update_network_now()
+            
         self.current_element = element
+        
+        # Drop station lists computed against an older inventory revision
+        if self.inventory_model:
+            revision = self.inventory_model.revision
+            self._stations_cache = {
+                key: stations for key, stations in self._stations_cache.items()
+                if key[1] == revision
+            }
+            
         if element is None:
             return
             
@@ -244,11 +274,21 @@ class NetworkTab(QWidget):
         self.network_restricted.setText(data.restricted)
         self.network_shared.setText(data.shared)
         
+        self._snapshot = asdict(data)
         self.status_label.setText("")
         
-    def get_current_data(self) -> Dict[str, str]:
-        """Get current field values"""
-        return {
+        # The station list is cached per network and revision, so show_map
+        # reuses it and reselecting a network does not rescan its stations
+        self.view_map_button.setEnabled(len(self.get_network_stations()) > 0)
+        
+    def get_current_data(self, changed_only: bool = False) -> Dict[str, str]:
+        """
+        Get current field values
+        
+        Args:
+            changed_only: Only include fields that differ from the loaded element
+        """
+        data = {
             'code': self.network_code.text(),
             'start': self.network_start.text(),
             'end': self.network_end.text(),
@@ -261,6 +301,10 @@ class NetworkTab(QWidget):
             'restricted': self.network_restricted.text().lower(),
             'shared': self.network_shared.text().lower()
         }
+        if changed_only:
+            return {key: value for key, value in data.items()
+                    if self._snapshot.get(key) != value}
+        return data
         
     def validate_all(self) -> bool:
         """Validate all input fields"""
@@ -277,34 +321,37 @@ class NetworkTab(QWidget):
         if not self.current_element or not self.inventory_model:
             return
             
+        # Validate first: it may rewrite datetime fields into SeisComP format
         if not self.validate_all():
-            self.status_label.setText("Please correct the invalid fields")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+            self.status_label.set_status("Please correct the invalid fields", StatusLabel.ERROR)
+            return
+            
+        data = self.get_current_data(changed_only=True)
+        if not data:
+            self.status_label.set_status("No changes to update", StatusLabel.INFO)
             return
             
         try:
-            data = self.get_current_data()
-            if self.inventory_model.update_network(self.current_element, data):
-                self.status_label.setText("Network updated successfully")
-                self.status_label.setStyleSheet("QLabel { color: #5cb85c; }")
-                self.networkUpdated.emit()
+            updated = self.inventory_model.update_network(self.current_element, data)
+            self._snapshot.update(data)
+            if updated:
+                self._stations_cache.clear()
+                self.status_label.set_status("Network updated successfully", StatusLabel.OK)
+                # May run from set_current_element inside the tree's selection
+                # change; listeners rebuild the tree, so emit once that returns
+                QTimer.singleShot(0, self.networkUpdated.emit)
             else:
-                self.status_label.setText("No changes to update")
-                self.status_label.setStyleSheet("QLabel { color: #666; }")
+                self.status_label.set_status("No changes to update", StatusLabel.INFO)
                 
         except Exception as e:
-            self.status_label.setText(f"Error updating network: {str(e)}")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+            self.status_label.set_status(f"Error updating network: {str(e)}", StatusLabel.ERROR)
+            
+    def update_network_now(self):
+        """Update immediately, cancelling any pending debounced update"""
+        self._commit_timer.stop()
+        self.update_network()
             
     def handle_editing_finished(self):
         """Called when editing is finished in any field"""
         if self.current_element:
-            self.update_network()
-
-    def __del__(self):
-        """Cleanup temporary map files"""
-        if self.map_file and os.path.exists(self.map_file):
-            try:
-                os.unlink(self.map_file)
-            except:
-                pass
\ No newline at end of file
+            self._commit_timer.start()
@@ -1,11 +1,13 @@
 # gui/tabs/sensor_tab.py
 from PyQt5.QtWidgets import (QWidget, QFormLayout, QGroupBox, QPushButton, 
-                           QVBoxLayout, QLabel, QLineEdit, QComboBox)
-from PyQt5.QtCore import pyqtSignal
-from gui.widgets.validation import ValidationLineEdit
+                           QVBoxLayout, QLineEdit, QComboBox)
+from PyQt5.QtCore import pyqtSignal, QTimer, QSignalBlocker
+from gui.widgets.validation import ValidationLineEdit, double_input_validator, datetime_input_validator
+from gui.widgets.status_label import StatusLabel
+from gui.widgets.form_rows import add_form_rows
 from typing import Optional, Dict
+import logging
 from xml.etree import ElementTree as ET
-import re
 from core.datetime_validation import DateTimeValidator
 
 class SensorTab(QWidget):
@@ -14,7 +16,7 @@ class SensorTab(QWidget):
     sensorUpdated = pyqtSignal()  # Signal when sensor is updated
     
     # Common sensor types for dropdown
-    SENSOR_TYPES = [
+    SENSOR_TYPES = (
         "Accelerometer",
         "Broadband",
         "Electric-Field",
@@ -27,12 +29,21 @@ class SensorTab(QWidget):
         "Temperature",
         "Water-Level",
         "Other"
-    ]
+    )
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_element = None
         self.inventory_model = None
+        self.logger = logging.getLogger('SensorTab')
+        self._last_committed: Dict[str, str] = {}  # Field values matching the element
+        self._invalid_fields = set()  # Validated fields currently failing validation
+        
+        # Coalesce editingFinished bursts (tabbing through fields) into one update
+        self._commit_timer = QTimer(self)
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(200)
+        self._commit_timer.timeout.connect(self.update_sensor)
         self.setup_ui()
         
     def setup_ui(self):
@@ -47,50 +58,40 @@ class SensorTab(QWidget):
         self.sensor_name = ValidationLineEdit(required=True, parent=self)
         self.sensor_type = QComboBox(self)
         self.sensor_type.setEditable(True)
-        self.sensor_type.addItems(self.SENSOR_TYPES)
+        self.sensor_type.insertItems(0, self.SENSOR_TYPES)
         self.sensor_type.setCurrentText("")
         
         self.sensor_model = ValidationLineEdit(parent=self)
         self.sensor_manufacturer = ValidationLineEdit(parent=self)
 
         self.sensor_serial = ValidationLineEdit(
-            validator=lambda x: bool(x.strip()),
+            validator='required',
             required=True, 
             parent=self)
 
         self.sensor_response = ValidationLineEdit(parent=self)
         self.sensor_unit = ValidationLineEdit(parent=self)
-        self.sensor_lowFreq = ValidationLineEdit(
-            validator=lambda x: x.replace('.', '', 1).isdigit() if x else True,
-            parent=self
-        )
-        self.sensor_highFreq = ValidationLineEdit(
-            validator=lambda x: x.replace('.', '', 1).isdigit() if x else True,
-            parent=self
-        )
+        self.sensor_lowFreq = ValidationLineEdit(parent=self)
+        self.sensor_highFreq = ValidationLineEdit(parent=self)
+        self.sensor_lowFreq.setValidator(double_input_validator(self))
+        self.sensor_highFreq.setValidator(double_input_validator(self))
         
-        # Add tooltips
-        self.sensor_name.setToolTip("Sensor name (required)")
-        self.sensor_type.setToolTip("Type of sensor")
-        self.sensor_model.setToolTip("Sensor model number/name")
-        self.sensor_manufacturer.setToolTip("Manufacturer name")
-        self.sensor_serial.setToolTip("Serial number (required)")
+        # Handle serial number edits
         self.sensor_serial.editingFinished.connect(self.handle_editing_finished)
-        self.sensor_response.setToolTip("Response reference")
-        self.sensor_unit.setToolTip("Measurement unit")
-        self.sensor_lowFreq.setToolTip("Lower frequency limit (Hz)")
-        self.sensor_highFreq.setToolTip("Upper frequency limit (Hz)")
         
         # Add fields to layout
-        sensor_layout.addRow("Name:", self.sensor_name)
-        sensor_layout.addRow("Type:", self.sensor_type)
-        sensor_layout.addRow("Model:", self.sensor_model)
-        sensor_layout.addRow("Manufacturer:", self.sensor_manufacturer)
-        sensor_layout.addRow("Serial Number:", self.sensor_serial)
-        sensor_layout.addRow("Response:", self.sensor_response)
-        sensor_layout.addRow("Unit:", self.sensor_unit)
-        sensor_layout.addRow("Low Frequency (Hz):", self.sensor_lowFreq)
-        sensor_layout.addRow("High Frequency (Hz):", self.sensor_highFreq)
+        rows = (
+            ("Name:", self.sensor_name, "Sensor name (required)"),
+            ("Type:", self.sensor_type, "Type of sensor"),
+            ("Model:", self.sensor_model, "Sensor model number/name"),
+            ("Manufacturer:", self.sensor_manufacturer, "Manufacturer name"),
+            ("Serial Number:", self.sensor_serial, "Serial number (required)"),
+            ("Response:", self.sensor_response, "Response reference"),
+            ("Unit:", self.sensor_unit, "Measurement unit"),
+            ("Low Frequency (Hz):", self.sensor_lowFreq, "Lower frequency limit (Hz)"),
+            ("High Frequency (Hz):", self.sensor_highFreq, "Upper frequency limit (Hz)"),
+        )
+        add_form_rows(sensor_layout, rows)
         
         sensor_group.setLayout(sensor_layout)
         layout.addWidget(sensor_group)
@@ -103,45 +104,32 @@ class SensorTab(QWidget):
             validator=self.validate_datetime,
             parent=self
         )
-        self.calib_scale = ValidationLineEdit(
-            validator=lambda x: x.replace('.', '', 1).isdigit() if x else True,
-            parent=self
-        )
+        self.calib_scale = ValidationLineEdit(parent=self)
+        self.calib_date.setValidator(datetime_input_validator(self))
+        self.calib_scale.setValidator(double_input_validator(self))
         
-        calib_layout.addRow("Calibration Date:", self.calib_date)
-        calib_layout.addRow("Scale Factor:", self.calib_scale)
+        calib_rows = (
+            ("Calibration Date:", self.calib_date, None),
+            ("Scale Factor:", self.calib_scale, None),
+        )
+        add_form_rows(calib_layout, calib_rows)
         
         calib_group.setLayout(calib_layout)
         layout.addWidget(calib_group)
         
         # Add update button
         self.update_button = QPushButton("Update Sensor")
-        self.update_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
-        self.update_button.clicked.connect(self.update_sensor)
+        self.update_button.setProperty('class', 'primary')  # Styled by the application sheet
+        self.update_button.clicked.connect(self.update_sensor_now)
         layout.addWidget(self.update_button)
         
+        # Track field validity as it changes instead of re-validating on update
+        self._tracked_fields = (self.sensor_name, self.sensor_serial, self.calib_date)
+        for field in self._tracked_fields:
+            field.validationChanged.connect(self._on_validation_changed)
+        
         # Add status label
-        self.status_label = QLabel()
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #666;
-                padding: 5px;
-            }
-        """)
+        self.status_label = StatusLabel()
         layout.addWidget(self.status_label)
         
     def set_inventory_model(self, model):
@@ -150,8 +138,11 @@ class SensorTab(QWidget):
         
     def set_current_element(self, element: Optional[ET.Element]):
         """Set current sensor element and populate fields"""
-        print("\n=== Sensor Tab Debug ===")
-        print(f"Setting sensor element: {element is not None}")
+        # Commit any pending edit to the element it was made on
+        if self._commit_timer.isActive():
+            self.update_sensor_now()
+            
+        self.logger.debug("Setting sensor element: %s", element is not None)
 
         self.current_element = element
         if element is None:
@@ -159,24 +150,31 @@ class SensorTab(QWidget):
             
         # Get sensor data
         data = self.inventory_model.get_sensor_data(element)
-        print(f"Sensor data loaded:")
-        print(f"- Name: {data.name}")
-        print(f"- Serial Number: {data.serialNumber}")  # Debug serial number
-        print(f"- Model: {data.model}")
+        self.logger.debug("Sensor data loaded - Name: %s, Serial Number: %s, Model: %s",
+                          data.name, data.serialNumber, data.model)
+        
+        # Populate fields without per-field textChanged validation
+        with QSignalBlocker(self.sensor_type):
+            self.sensor_type.setCurrentText(data.type)
+        for field, value in (
+            (self.sensor_name, data.name),
+            (self.sensor_model, data.model),
+            (self.sensor_manufacturer, data.manufacturer),
+            (self.sensor_serial, data.serialNumber),
+            (self.sensor_response, data.response),
+            (self.sensor_unit, data.unit),
+            (self.sensor_lowFreq, data.lowFrequency),
+            (self.sensor_highFreq, data.highFrequency),
+            (self.calib_date, data.calibrationDate),
+            (self.calib_scale, data.calibrationScale),
+        ):
+            with QSignalBlocker(field):
+                field.setText(value)
         
-        # Populate fields
-        self.sensor_name.setText(data.name)
-        self.sensor_type.setCurrentText(data.type)
-        self.sensor_model.setText(data.model)
-        self.sensor_manufacturer.setText(data.manufacturer)
-        self.sensor_serial.setText(data.serialNumber)
-        self.sensor_response.setText(data.response)
-        self.sensor_unit.setText(data.unit)
-        self.sensor_lowFreq.setText(data.lowFrequency)
-        self.sensor_highFreq.setText(data.highFrequency)
-        self.calib_date.setText(data.calibrationDate)
-        self.calib_scale.setText(data.calibrationScale)
+        # Validate (and style) the populated form once
+        self.validate_all()
         
+        self._last_committed = self.get_current_data()
         self.status_label.setText("")
         
     def get_current_data(self) -> Dict[str, str]:
@@ -200,52 +198,23 @@ class SensorTab(QWidget):
         """Validate datetime string format"""
         return DateTimeValidator.validate(text)
             
-        # datetime_pattern = r'^\d{4}-\d{2}-\d{2}(?:\s\d{2}:\d{2}:\d{2})?$'
-        # if not re.match(datetime_pattern, text):
-        #     return False
-            
-        # try:
-        #     parts = text.split()
-        #     date_parts = parts[0].split('-')
-            
-        #     year = int(date_parts[0])
-        #     month = int(date_parts[1])
-        #     day = int(date_parts[2])
-            
-        #     if not (1900 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31):
-        #         return False
-                
-        #     if len(parts) > 1:
-        #         time_parts = parts[1].split(':')
-        #         hour = int(time_parts[0])
-        #         minute = int(time_parts[1])
-        #         second = int(time_parts[2])
-                
-        #         if not (0 <= hour <= 23 and 0 <= minute <= 59 and 0 <= second <= 59):
-        #             return False
-                    
-        #     return True
-            
-        # except (ValueError, IndexError):
-        #     return False
-            
     def validate_frequency(self) -> bool:
         """Validate frequency values"""
         try:
-            if self.sensor_lowFreq.text():
-                low_freq = float(self.sensor_lowFreq.text())
-                if low_freq < 0:
-                    return False
-                    
-            if self.sensor_highFreq.text():
-                high_freq = float(self.sensor_highFreq.text())
-                if high_freq < 0:
-                    return False
+            # Read and parse each field once
+            low_text = self.sensor_lowFreq.text()
+            high_text = self.sensor_highFreq.text()
+            low_freq = float(low_text) if low_text else None
+            high_freq = float(high_text) if high_text else None
+            
+            if low_freq is not None and low_freq < 0:
+                return False
+            if high_freq is not None and high_freq < 0:
+                return False
                     
             # If both are provided, check high > low
-            if self.sensor_lowFreq.text() and self.sensor_highFreq.text():
-                if float(self.sensor_highFreq.text()) <= float(self.sensor_lowFreq.text()):
-                    return False
+            if low_freq is not None and high_freq is not None and high_freq <= low_freq:
+                return False
                     
             return True
             
@@ -280,26 +249,48 @@ class SensorTab(QWidget):
         if not self.current_element or not self.inventory_model:
             return
             
-        if not self.validate_all():
-            self.status_label.setText("Please correct the invalid fields")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+        # Settle validations still waiting on the typing delay; they keep the
+        # invalid set current and may rewrite datetime fields
+        for field in self._tracked_fields:
+            field.validate()
+            
+        data = self.get_current_data()
+        if data == self._last_committed:
+            self.status_label.set_status("No changes to update", StatusLabel.INFO)
+            return
+            
+        if self._invalid_fields or not (self.validate_frequency() and self.validate_calibration()):
+            self.status_label.set_status("Please correct the invalid fields", StatusLabel.ERROR)
             return
             
         try:
-            data = self.get_current_data()
-            if self.inventory_model.update_sensor(self.current_element, data):
-                self.status_label.setText("Sensor updated successfully")
-                self.status_label.setStyleSheet("QLabel { color: #5cb85c; }")
-                self.sensorUpdated.emit()
+            updated = self.inventory_model.update_sensor(self.current_element, data)
+            self._last_committed = data
+            if updated:
+                self.status_label.set_status("Sensor updated successfully", StatusLabel.OK)
+                # May run from set_current_element inside the tree's selection
+                # change; listeners rebuild the tree, so emit once that returns
+                QTimer.singleShot(0, self.sensorUpdated.emit)
             else:
-                self.status_label.setText("No changes to update")
-                self.status_label.setStyleSheet("QLabel { color: #666; }")
+                self.status_label.set_status("No changes to update", StatusLabel.INFO)
                 
         except Exception as e:
-            self.status_label.setText(f"Error updating sensor: {str(e)}")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+            self.status_label.set_status(f"Error updating sensor: {str(e)}", StatusLabel.ERROR)
+            
+    def _on_validation_changed(self, valid: bool):
+        """Keep the set of invalid fields and the update button in sync"""
+        if valid:
+            self._invalid_fields.discard(self.sender())
+        else:
+            self._invalid_fields.add(self.sender())
+        self.update_button.setEnabled(not self._invalid_fields)
+        
+    def update_sensor_now(self):
+        """Update immediately, cancelling any pending debounced update"""
+        self._commit_timer.stop()
+        self.update_sensor()
             
     def handle_editing_finished(self):
         """Called when editing is finished in any field"""
         if self.current_element:
-            self.update_sensor()
\ No newline at end of file
+            self._commit_timer.start()
\ No newline at end of file
@@ -1,17 +1,56 @@
 # gui/tabs/station_tab.py
 from PyQt5.QtWidgets import (QWidget, QFormLayout, QGroupBox, QPushButton, 
-                           QVBoxLayout, QLabel, QApplication)
-from PyQt5.QtCore import pyqtSignal
-from gui.widgets.validation import ValidationLineEdit
-import re
+                           QVBoxLayout, QApplication)
+from PyQt5.QtCore import pyqtSignal, QTimer, QSignalBlocker
+from gui.widgets.validation import (ValidationLineEdit, VKind, parse_signed_decimal,
+                                   double_input_validator, datetime_input_validator)
+from gui.widgets.status_label import StatusLabel
+from gui.widgets.form_rows import add_form_rows
 from typing import Optional, Dict
 from xml.etree import ElementTree as ET
-import folium
+from core.datetime_validation import DateTimeValidator
 import os
-import tempfile
+import weakref
+import html
+import json
+from string import Template
 from PyQt5.QtCore import QUrl
 from PyQt5.QtGui import QDesktopServices
 
+# Single-marker Leaflet page; filled in with string.Template, so station
+# maps need neither folium nor a template engine
+_STATION_MAP_HTML = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title</title>
+    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css">
+    <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
+    <style>
+        html, body, #map { width: 100%; height: 100%; margin: 0; }
+    </style>
+</head>
+<body>
+    <div id="map"></div>
+    <script>
+        var map = L.map('map').setView([$lat, $lon], 10);
+        L.tileLayer('https://mt1.google.com/vt/lyrs=y&x={x}&y={y}&z={z}', {
+            attribution: 'Google Maps'
+        }).addTo(map);
+        L.marker([$lat, $lon]).bindPopup($popup).addTo(map);
+    </script>
+</body>
+</html>
+""")
+
+def _remove_map_file(path: str) -> None:
+    """Delete a temporary map file if it still exists"""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
 class StationTab(QWidget):
     """Tab for editing station information"""
     
@@ -21,7 +60,16 @@ class StationTab(QWidget):
         super().__init__(parent)
         self.current_element = None
         self.inventory_model = None
+        self._last_committed: Dict[str, str] = {}  # Field values matching the element
+        self._invalid_fields = set()  # Validated fields currently failing validation
+        
+        # Coalesce editingFinished bursts (tabbing through fields) into one update
+        self._commit_timer = QTimer(self)
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(200)
+        self._commit_timer.timeout.connect(self.update_station)
         self.map_file = None
+        self._map_key = None  # (lat, lon, name) the map file was last rendered for
         self.setup_ui()
         
     def setup_ui(self):
@@ -44,130 +92,93 @@ class StationTab(QWidget):
             validator=self.validate_datetime,
             parent=self
         )
-        self.station_lat = ValidationLineEdit(
-            validator=lambda x: re.match(r'^-?\d*\.?\d*$', x) and -90 <= float(x) <= 90 if x else True,
-            parent=self
-        )
-        self.station_lon = ValidationLineEdit(
-            validator=lambda x: re.match(r'^-?\d*\.?\d*$', x) and -180 <= float(x) <= 180 if x else True,
-            parent=self
-        )
-        self.station_elevation = ValidationLineEdit(
-            validator=lambda x: re.match(r'^-?\d*\.?\d*$', x) if x else True,
-            parent=self
-        )
+        self.station_lat = ValidationLineEdit(validator=VKind.LAT, parent=self)
+        self.station_lon = ValidationLineEdit(validator=VKind.LON, parent=self)
+        self.station_elevation = ValidationLineEdit(validator=VKind.DECIMAL, parent=self)
+        
+        # Numeric and datetime input is filtered per keystroke by Qt;
+        # validate_all still checks the final values
+        self.station_lat.setValidator(double_input_validator(self))
+        self.station_lon.setValidator(double_input_validator(self))
+        self.station_elevation.setValidator(double_input_validator(self))
+        self.station_start.setValidator(datetime_input_validator(self))
+        self.station_end.setValidator(datetime_input_validator(self))
         self.station_affiliation = ValidationLineEdit(parent=self)
         self.station_country = ValidationLineEdit(parent=self)
         self.station_place = ValidationLineEdit(parent=self)
         
-        # Add tooltips
-        self.station_code.setToolTip("Station code (required)")
-        self.station_name.setToolTip("Station name")
-        self.station_lat.setToolTip("Latitude in decimal degrees (-90 to 90)")
-        self.station_lon.setToolTip("Longitude in decimal degrees (-180 to 180)")
-        self.station_elevation.setToolTip("Elevation in meters above sea level")
-        self.station_start.setToolTip("Start date/time (YYYY-MM-DD HH:MM:SS)")
-        self.station_end.setToolTip("End date/time (YYYY-MM-DD HH:MM:SS)")
-        
         # Add fields to layout
-        station_layout.addRow("Code:", self.station_code)
-        station_layout.addRow("Name:", self.station_name)
-        station_layout.addRow("Description:", self.station_description)
-        station_layout.addRow("Start Time:", self.station_start)
-        station_layout.addRow("End Time:", self.station_end)
-        station_layout.addRow("Latitude (°):", self.station_lat)
-        station_layout.addRow("Longitude (°):", self.station_lon)
-        station_layout.addRow("Elevation (m):", self.station_elevation)
-        station_layout.addRow("Affiliation:", self.station_affiliation)
-        station_layout.addRow("Country:", self.station_country)
-        station_layout.addRow("Place:", self.station_place)
+        rows = (
+            ("Code:", self.station_code, "Station code (required)"),
+            ("Name:", self.station_name, "Station name"),
+            ("Description:", self.station_description, None),
+            ("Start Time:", self.station_start, "Start date/time (YYYY-MM-DD HH:MM:SS)"),
+            ("End Time:", self.station_end, "End date/time (YYYY-MM-DD HH:MM:SS)"),
+            ("Latitude (°):", self.station_lat, "Latitude in decimal degrees (-90 to 90)"),
+            ("Longitude (°):", self.station_lon, "Longitude in decimal degrees (-180 to 180)"),
+            ("Elevation (m):", self.station_elevation, "Elevation in meters above sea level"),
+            ("Affiliation:", self.station_affiliation, None),
+            ("Country:", self.station_country, None),
+            ("Place:", self.station_place, None),
+        )
+        add_form_rows(station_layout, rows)
         
         station_group.setLayout(station_layout)
         layout.addWidget(station_group)
 
-        # Add map button
+        # Add map button, spaced off the form
+        layout.addSpacing(10)
         self.view_map_button = QPushButton("View Station Location on Map")
-        self.view_map_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-                margin-top: 10px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.view_map_button.setProperty('class', 'primary')  # Styled by the application sheet
         self.view_map_button.clicked.connect(self.show_map)
         layout.addWidget(self.view_map_button)
         
         # Add update button
         self.update_button = QPushButton("Update Station")
-        self.update_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
-        self.update_button.clicked.connect(self.update_station)
+        self.update_button.setProperty('class', 'primary')  # Styled by the application sheet
+        self.update_button.clicked.connect(self.update_station_now)
         layout.addWidget(self.update_button)
         
+        # Track field validity as it changes instead of re-validating on update
+        self._tracked_fields = (self.station_code, self.station_start, self.station_end,
+                                self.station_lat, self.station_lon, self.station_elevation)
+        for field in self._tracked_fields:
+            field.validationChanged.connect(self._on_validation_changed)
+        
         # Add status label
-        self.status_label = QLabel()
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #666;
-                padding: 5px;
-            }
-        """)
+        self.status_label = StatusLabel()
         layout.addWidget(self.status_label)
 
-        # Connect coordinate fields to map updates
-        self.station_lat.editingFinished.connect(self.update_map_location)
-        self.station_lon.editingFinished.connect(self.update_map_location)
-
-    def create_map(self, lat, lon, station_name):
+    def create_map(self, lat: float, lon: float, station_name: str):
         """Create a map with station marker"""
         try:
-            # Create a map centered at the station
-            m = folium.Map(
-                location=[float(lat), float(lon)],
-                zoom_start=10,
-                tiles='https://mt1.google.com/vt/lyrs=y&x={x}&y={y}&z={z}',
-                attr='Google Maps'
+            # The last rendered map is still valid if nothing shown on it changed
+            key = (lat, lon, station_name)
+            if key == self._map_key and self.map_file and os.path.exists(self.map_file):
+                return True
+                
+            # Create a map centered at the station, with a marker for it
+            label = html.escape(station_name or 'Station Location')
+            page = _STATION_MAP_HTML.substitute(
+                title=label,
+                lat=repr(key[0]),
+                lon=repr(key[1]),
+                # Escaped label, JSON-encoded into a JS string literal
+                popup=json.dumps(label)
             )
 
-            # Add marker for station
-            folium.Marker(
-                [float(lat), float(lon)],
-                popup=station_name or 'Station Location',
-                icon=folium.Icon(color='red', icon='info-sign')
-            ).add_to(m)
-
-            # Save to temporary file
-            if self.map_file:
-                try:
-                    os.unlink(self.map_file)
-                except:
-                    pass
-
-            fd, self.map_file = tempfile.mkstemp(suffix='.html')
-            os.close(fd)
-            m.save(self.map_file)
+            # Save to a securely created temporary file, overwritten on each call
+            if not self.map_file:
+                import tempfile
+                fd, self.map_file = tempfile.mkstemp(prefix='seiscomp_sta_', suffix='.html')
+                # Removed when the tab is collected or at interpreter exit
+                weakref.finalize(self, _remove_map_file, self.map_file)
+                f = os.fdopen(fd, 'w', encoding='utf-8')
+            else:
+                f = open(self.map_file, 'w', encoding='utf-8')
+            with f:
+                f.write(page)
+            self._map_key = key
 
             return True
         except Exception as e:
@@ -176,35 +187,20 @@ class StationTab(QWidget):
 
     def show_map(self):
         """Show the map in default web browser"""
-        lat = self.station_lat.text()
-        lon = self.station_lon.text()
+        lat = parse_signed_decimal(self.station_lat.text())
+        lon = parse_signed_decimal(self.station_lon.text())
         station_name = self.station_name.text() or self.station_code.text()
 
-        if lat and lon:
+        if lat is not None and lon is not None:
             try:
                 if self.create_map(lat, lon, station_name):
                     QDesktopServices.openUrl(QUrl.fromLocalFile(self.map_file))
                 else:
-                    self.status_label.setText("Error creating map")
-                    self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+                    self.status_label.set_status("Error creating map", StatusLabel.ERROR)
             except Exception as e:
-                self.status_label.setText(f"Error showing map: {str(e)}")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+                self.status_label.set_status(f"Error showing map: {str(e)}", StatusLabel.ERROR)
         else:
-            self.status_label.setText("Please enter valid coordinates")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-
-    def update_map_location(self):
-        """Update map when coordinates change"""
-        lat = self.station_lat.text()
-        lon = self.station_lon.text()
-        if lat and lon:
-            try:
-                float(lat)  # Validate coordinates
-                float(lon)
-                # Map will be updated when "View Map" is clicked
-            except ValueError:
-                pass
+            self.status_label.set_status("Please enter valid coordinates", StatusLabel.ERROR)
 
     def set_inventory_model(self, model):
         """Set the inventory model reference"""
@@ -212,6 +208,10 @@ class StationTab(QWidget):
         
     def set_current_element(self, element: Optional[ET.Element]):
         """Set current station element and populate fields"""
+        # Commit any pending edit to the element it was made on
+        if self._commit_timer.isActive():
+            self.update_station_now()
+            
         self.current_element = element
         if element is None:
             return
@@ -219,19 +219,27 @@ class StationTab(QWidget):
         # Get station data
         data = self.inventory_model.get_station_data(element)
         
-        # Populate fields
-        self.station_code.setText(data.code)
-        self.station_name.setText(data.name)
-        self.station_description.setText(data.description)
-        self.station_start.setText(data.start)
-        self.station_end.setText(data.end)
-        self.station_lat.setText(data.latitude)
-        self.station_lon.setText(data.longitude)
-        self.station_elevation.setText(data.elevation)
-        self.station_affiliation.setText(data.affiliation)
-        self.station_country.setText(data.country)
-        self.station_place.setText(data.place)
+        # Populate fields without per-field textChanged validation
+        for field, value in (
+            (self.station_code, data.code),
+            (self.station_name, data.name),
+            (self.station_description, data.description),
+            (self.station_start, data.start),
+            (self.station_end, data.end),
+            (self.station_lat, data.latitude),
+            (self.station_lon, data.longitude),
+            (self.station_elevation, data.elevation),
+            (self.station_affiliation, data.affiliation),
+            (self.station_country, data.country),
+            (self.station_place, data.place),
+        ):
+            with QSignalBlocker(field):
+                field.setText(value)
+        
+        # Validate (and style) the populated form once
+        self.validate_all()
         
+        self._last_committed = self.get_current_data()
         self.status_label.setText("")
 
     def get_current_data(self) -> Dict[str, str]:
@@ -252,8 +260,6 @@ class StationTab(QWidget):
 
     def validate_datetime(self, text: str) -> bool:
         """Validate datetime string format"""
-        from core.datetime_validation import DateTimeValidator
-        
         if DateTimeValidator.validate(text):
             # If valid, automatically convert to SeisComP format
             if text:
@@ -269,30 +275,11 @@ class StationTab(QWidget):
             
     def validate_elevation(self) -> bool:
         """Validate elevation"""
-        try:
-            if self.station_elevation.text():
-                float(self.station_elevation.text())  # Just check if it's a valid float
-            return True
-        except ValueError:
-            return False
+        return self.station_elevation.validate()
 
     def validate_coordinates(self) -> bool:
         """Validate latitude and longitude"""
-        try:
-            if self.station_lat.text():
-                lat = float(self.station_lat.text())
-                if not -90 <= lat <= 90:
-                    return False
-                    
-            if self.station_lon.text():
-                lon = float(self.station_lon.text())
-                if not -180 <= lon <= 180:
-                    return False
-                    
-            return True
-            
-        except ValueError:
-            return False
+        return self.station_lat.validate() and self.station_lon.validate()
 
     def validate_all(self) -> bool:
         """Validate all input fields"""
@@ -309,34 +296,48 @@ class StationTab(QWidget):
         if not self.current_element or not self.inventory_model:
             return
             
-        if not self.validate_all():
-            self.status_label.setText("Please correct the invalid fields")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+        # Settle validations still waiting on the typing delay; they keep the
+        # invalid set current and may rewrite datetime fields
+        for field in self._tracked_fields:
+            field.validate()
+            
+        data = self.get_current_data()
+        if data == self._last_committed:
+            self.status_label.set_status("No changes to update", StatusLabel.INFO)
+            return
+            
+        if self._invalid_fields or not (self.validate_coordinates() and self.validate_elevation()):
+            self.status_label.set_status("Please correct the invalid fields", StatusLabel.ERROR)
             return
             
         try:
-            data = self.get_current_data()
-            if self.inventory_model.update_station(self.current_element, data):
-                self.status_label.setText("Station updated successfully")
-                self.status_label.setStyleSheet("QLabel { color: #5cb85c; }")
-                self.stationUpdated.emit()
+            updated = self.inventory_model.update_station(self.current_element, data)
+            self._last_committed = data
+            if updated:
+                self.status_label.set_status("Station updated successfully", StatusLabel.OK)
+                # May run from set_current_element inside the tree's selection
+                # change; listeners rebuild the tree, so emit once that returns
+                QTimer.singleShot(0, self.stationUpdated.emit)
             else:
-                self.status_label.setText("No changes to update")
-                self.status_label.setStyleSheet("QLabel { color: #666; }")
+                self.status_label.set_status("No changes to update", StatusLabel.INFO)
                 
         except Exception as e:
-            self.status_label.setText(f"Error updating station: {str(e)}")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+            self.status_label.set_status(f"Error updating station: {str(e)}", StatusLabel.ERROR)
+            
+    def _on_validation_changed(self, valid: bool):
+        """Keep the set of invalid fields and the update button in sync"""
+        if valid:
+            self._invalid_fields.discard(self.sender())
+        else:
+            self._invalid_fields.add(self.sender())
+        self.update_button.setEnabled(not self._invalid_fields)
+        
+    def update_station_now(self):
+        """Update immediately, cancelling any pending debounced update"""
+        self._commit_timer.stop()
+        self.update_station()
             
     def handle_editing_finished(self):
         """Called when editing is finished in any field"""
         if self.current_element:
-            self.update_station()
-
-    def __del__(self):
-        """Cleanup temporary map files"""
-        if self.map_file and os.path.exists(self.map_file):
-            try:
-                os.unlink(self.map_file)
-            except:
-                pass
\ No newline at end of file
+            self._commit_timer.start()
@@ -1,22 +1,61 @@
 # gui/tabs/stream_tab.py
 from PyQt5.QtWidgets import (QWidget, QFormLayout, QGroupBox, QPushButton, 
-                           QVBoxLayout, QLabel, QComboBox, QLineEdit)
-from PyQt5.QtCore import pyqtSignal
-from gui.widgets.validation import ValidationLineEdit
+                           QVBoxLayout, QComboBox, QLineEdit)
+from PyQt5.QtCore import pyqtSignal, QSignalBlocker, QTimer
+from gui.widgets.validation import ValidationLineEdit, decimal_in_range, parse_signed_decimal
+from gui.widgets.status_label import StatusLabel
+from gui.widgets.form_rows import add_form_rows
+from gui.widgets.lazy_combo import LazyComboBox
 import re
-from typing import Optional, Dict, List
+import logging
+from functools import lru_cache, partial
+from typing import Optional, Dict, List, Tuple
 from xml.etree import ElementTree as ET
 from core.datetime_validation import DateTimeValidator  
 
+# Field patterns, compiled once instead of per keystroke
+_SIGNED_RE = re.compile(r'^-?\d*\.?\d*$')
+_SCIENTIFIC_RE = re.compile(r'^-?\d*\.?\d+(?:[eE][+-]?\d+)?$')
+
+def _is_signed(text: str) -> bool:
+    """Accept an optionally signed decimal, or empty"""
+    return not text or _SIGNED_RE.match(text) is not None
+
+def _is_scientific(text: str) -> bool:
+    """Accept a decimal with optional exponent, or empty"""
+    return not text or _SCIENTIFIC_RE.match(text) is not None
+
+@lru_cache(maxsize=64)
+def _parse_scientific(text: str) -> Optional[float]:
+    """Parse a decimal with optional exponent, or None if text is not one"""
+    return float(text) if _SCIENTIFIC_RE.match(text) else None
+
+# Fields whose values are stored without surrounding whitespace
+_STRIPPED_KEYS = ('sampleRateNumerator', 'sampleRateDenominator', 'flags')
+
 class StreamTab(QWidget):
     """Tab for editing stream information"""
     
     streamUpdated = pyqtSignal()  # Signal when stream is updated
     
+    SENSOR_PLACEHOLDER = "Select Sensor..."
+    DATALOGGER_PLACEHOLDER = "Select Datalogger..."
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_element = None
         self.inventory_model = None
+        self.logger = logging.getLogger('StreamTab')
+        self._loaded_data: Dict[str, str] = {}  # Field values matching the element
+        # Combo item data -> index, rebuilt whenever a combo is filled
+        self._sensor_index: Dict[str, int] = {}
+        self._datalogger_index: Dict[str, int] = {}
+        
+        # Coalesce editingFinished bursts (tabbing through fields) into one update
+        self._commit_timer = QTimer(self)
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(150)
+        self._commit_timer.timeout.connect(self.update_stream)
         self.setup_ui()
         
     def setup_ui(self):
@@ -39,35 +78,35 @@ class StreamTab(QWidget):
             parent=self
         )
         self.stream_depth = ValidationLineEdit(
-            validator=lambda x: re.match(r'^-?\d*\.?\d*$', x) if x else True,
+            validator=_is_signed,
             parent=self
         )
         self.stream_azimuth = ValidationLineEdit(
-            validator=lambda x: re.match(r'^-?\d*\.?\d*$', x) and 0 <= float(x) <= 360 if x else True,
+            validator=partial(decimal_in_range, low=0, high=360),
             parent=self
         )
         self.stream_dip = ValidationLineEdit(
-            validator=lambda x: re.match(r'^-?\d*\.?\d*$', x) and -90 <= float(x) <= 90 if x else True,
+            validator=partial(decimal_in_range, low=-90, high=90),
             parent=self
         )
         self.stream_gain = ValidationLineEdit(
-            validator=lambda x: bool(re.match(r'^-?\d*\.?\d+(?:[eE][+-]?\d+)?$', x)) if x else True,
+            validator=_is_scientific,
             parent=self
         )
 
         # Add sample rate field with proper validation
         self.stream_sampleRateNumerator = ValidationLineEdit(
-            validator=lambda x: bool(re.match(r'^\d+$', x)) if x else True,
+            validator='digits',
             parent=self
         )
         self.stream_sampleRateDenominator = ValidationLineEdit(
-            validator=lambda x: bool(re.match(r'^\d+$', x)) if x else True,
+            validator='digits',
             parent=self
         )
 
         # Updated gainFrequency validator similarly
         self.stream_gainFrequency = ValidationLineEdit(
-            validator=lambda x: bool(re.match(r'^-?\d*\.?\d+(?:[eE][+-]?\d+)?$', x)) if x else True,
+            validator=_is_scientific,
             parent=self
         )
 
@@ -85,160 +124,136 @@ class StreamTab(QWidget):
         self.datalogger_serial_display.setPlaceholderText("Datalogger Serial Number")
 
 
-        # Create sensor and datalogger combo boxes
-        self.sensor_combo = QComboBox(self)
-        self.datalogger_combo = QComboBox(self)
-        
-        # Add tooltips
-        self.stream_code.setToolTip("Stream code (required)")
-        self.stream_start.setToolTip("Start date/time (YYYY-MM-DD HH:MM:SS)")
-        self.stream_end.setToolTip("End date/time (YYYY-MM-DD HH:MM:SS)")
-        self.stream_depth.setToolTip("Depth in meters below surface (positive down)")
-        self.stream_azimuth.setToolTip("Azimuth in degrees (0-360)")
-        self.stream_dip.setToolTip("Dip in degrees (-90 to 90)")
-        self.stream_gain.setToolTip("Gain value (scientific notation supported, e.g. 1.23e+10)")
-        self.stream_sampleRateNumerator.setToolTip("Sample rate numerator")
-        self.stream_sampleRateDenominator.setToolTip("Sample rate denominator")
-        self.stream_gainFrequency.setToolTip("Gain frequency in Hz")
-        self.stream_gainUnit.setToolTip("Gain unit")
-        self.stream_flags.setToolTip("Stream flags (e.g., G, GC)")
-
+        # Create sensor and datalogger combo boxes, filled when first needed
+        self.sensor_combo = LazyComboBox(self)
+        self.sensor_combo.addItem(self.SENSOR_PLACEHOLDER, None)
+        self.datalogger_combo = LazyComboBox(self)
+        self.datalogger_combo.addItem(self.DATALOGGER_PLACEHOLDER, None)
+        
+        # Data key -> widget for the editable text fields
+        self._fields = (
+            ('code', self.stream_code),
+            ('start', self.stream_start),
+            ('end', self.stream_end),
+            ('depth', self.stream_depth),
+            ('azimuth', self.stream_azimuth),
+            ('dip', self.stream_dip),
+            ('gain', self.stream_gain),
+            ('sampleRateNumerator', self.stream_sampleRateNumerator),
+            ('sampleRateDenominator', self.stream_sampleRateDenominator),
+            ('gainFrequency', self.stream_gainFrequency),
+            ('gainUnit', self.stream_gainUnit),
+            ('flags', self.stream_flags),
+        )
         
         # Add fields to layout
-        stream_layout.addRow("Code:", self.stream_code)
-        stream_layout.addRow("Start Time:", self.stream_start)
-        stream_layout.addRow("End Time:", self.stream_end)
-        stream_layout.addRow("Depth (m):", self.stream_depth)
-        stream_layout.addRow("Azimuth (°):", self.stream_azimuth)
-        stream_layout.addRow("Dip (°):", self.stream_dip)
-        stream_layout.addRow("Gain:", self.stream_gain)
-        stream_layout.addRow("Sample Rate Numerator:", self.stream_sampleRateNumerator)
-        stream_layout.addRow("Sample Rate Denominator:", self.stream_sampleRateDenominator)
-        stream_layout.addRow("Gain Frequency (Hz):", self.stream_gainFrequency)
-        stream_layout.addRow("Gain Unit:", self.stream_gainUnit)
-        stream_layout.addRow("Flags:", self.stream_flags)
-        stream_layout.addRow("Sensor Serial:", self.sensor_serial_display)
-        stream_layout.addRow("Datalogger Serial:", self.datalogger_serial_display)
-        stream_layout.addRow("Sensor:", self.sensor_combo)
-        stream_layout.addRow("Datalogger:", self.datalogger_combo)
+        rows = (
+            ("Code:", self.stream_code, "Stream code (required)"),
+            ("Start Time:", self.stream_start, "Start date/time (YYYY-MM-DD HH:MM:SS)"),
+            ("End Time:", self.stream_end, "End date/time (YYYY-MM-DD HH:MM:SS)"),
+            ("Depth (m):", self.stream_depth, "Depth in meters below surface (positive down)"),
+            ("Azimuth (°):", self.stream_azimuth, "Azimuth in degrees (0-360)"),
+            ("Dip (°):", self.stream_dip, "Dip in degrees (-90 to 90)"),
+            ("Gain:", self.stream_gain, "Gain value (scientific notation supported, e.g. 1.23e+10)"),
+            ("Sample Rate Numerator:", self.stream_sampleRateNumerator, "Sample rate numerator"),
+            ("Sample Rate Denominator:", self.stream_sampleRateDenominator, "Sample rate denominator"),
+            ("Gain Frequency (Hz):", self.stream_gainFrequency, "Gain frequency in Hz"),
+            ("Gain Unit:", self.stream_gainUnit, "Gain unit"),
+            ("Flags:", self.stream_flags, "Stream flags (e.g., G, GC)"),
+            ("Sensor Serial:", self.sensor_serial_display, None),
+            ("Datalogger Serial:", self.datalogger_serial_display, None),
+            ("Sensor:", self.sensor_combo, None),
+            ("Datalogger:", self.datalogger_combo, None),
+        )
+        add_form_rows(stream_layout, rows)
         
         stream_group.setLayout(stream_layout)
         layout.addWidget(stream_group)
         
         # Add update button
         self.update_button = QPushButton("Update Stream")
-        self.update_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
-        self.update_button.clicked.connect(self.update_stream)
+        self.update_button.setProperty('class', 'primary')  # Styled by the application sheet
+        self.update_button.clicked.connect(self.update_stream_now)
         layout.addWidget(self.update_button)
         
         # Add status label
-        self.status_label = QLabel()
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #666;
-                padding: 5px;
-            }
-        """)
+        self.status_label = StatusLabel()
         layout.addWidget(self.status_label)
         
     def set_inventory_model(self, model):
         """Set the inventory model reference"""
         self.inventory_model = model
-        self.populate_combos()
+        # Fill the combos on first use, and again once the inventory has changed
+        self.sensor_combo.set_loader(self._load_sensors, self._device_revision)
+        self.datalogger_combo.set_loader(self._load_dataloggers, self._device_revision)
+        
+    def _device_revision(self) -> int:
+        """Inventory sensor/datalogger revision, used to tell when the combos are stale"""
+        return self.inventory_model.device_revision
         
     def populate_combos(self):
         """Populate sensor and datalogger combo boxes"""
-        if not self.inventory_model:
-            return
+        self.sensor_combo.ensure_loaded()
+        self.datalogger_combo.ensure_loaded()
+        
+    def _load_sensors(self):
+        """Fill the sensor combo box from the inventory"""
+        self._sensor_index = self._fill_combo(
+            self.sensor_combo, self.SENSOR_PLACEHOLDER,
+            self.inventory_model.get_sensor_labels())
+        
+    def _load_dataloggers(self):
+        """Fill the datalogger combo box from the inventory"""
+        self._datalogger_index = self._fill_combo(
+            self.datalogger_combo, self.DATALOGGER_PLACEHOLDER,
+            self.inventory_model.get_datalogger_labels())
+        
+    @staticmethod
+    def _fill_combo(combo: QComboBox, placeholder: str,
+                    labels: List[Tuple[str, str, str]]) -> Dict[str, int]:
+        """
+        Replace the items of a combo box, keeping its current selection
+        
+        Args:
+            combo: Combo box to fill
+            placeholder: Text of the first, data-less item
+            labels: (name, manufacturer, model) tuples from the inventory model
             
-        # Clear existing items
-        self.sensor_combo.clear()
-        self.datalogger_combo.clear()
-        
-        # Add empty option
-        self.sensor_combo.addItem("Select Sensor...", None)
-        self.datalogger_combo.addItem("Select Datalogger...", None)
-        
-        # Add sensors
-        for sensor in self.inventory_model.get_sensors():
-            name = sensor.get('name', '')
-            model = self.inventory_model.xml_handler.get_element_text(sensor, 'model') or ''
-            manufacturer = self.inventory_model.xml_handler.get_element_text(sensor, 'manufacturer') or ''
-            display = f"{manufacturer} {model} - {name}" if manufacturer or model else name
-            if name:
-                self.sensor_combo.addItem(display, name)
-        
-        # Add dataloggers
-        for datalogger in self.inventory_model.get_dataloggers():
-            name = datalogger.get('name', '')
-            model = self.inventory_model.xml_handler.get_element_text(datalogger, 'model') or ''
-            manufacturer = self.inventory_model.xml_handler.get_element_text(datalogger, 'manufacturer') or ''
-            display = f"{manufacturer} {model} - {name}" if manufacturer or model else name
-            if name:
-                self.datalogger_combo.addItem(display, name)
-
-
-    def populate_sensor_datalogger(self):
-        """Populate sensor and datalogger combo boxes"""
-        print("\n=== Populating Sensor/Datalogger Combos Debug ===")
-        
-        if not self.inventory_model:
-            print("No inventory model available!")
-            return
-        
-        self.sensor_combo.clear()
-        self.datalogger_combo.clear()
-        
-        # Add empty options
-        self.sensor_combo.addItem("Select Sensor...", None)
-        self.datalogger_combo.addItem("Select Datalogger...", None)
-        
-        # Get all sensors
-        print("\nLoading sensors...")
-        for sensor in self.inventory_model.get_sensors():
-            name = sensor.get('name', '')
-            serial = self.inventory_model.xml_handler.get_element_text(sensor, 'serialNumber')
-            model = self.inventory_model.xml_handler.get_element_text(sensor, 'model') or ''
-            manufacturer = self.inventory_model.xml_handler.get_element_text(sensor, 'manufacturer') or ''
-            
-            if serial:  # Only add if has serial number
-                display_text = f"{manufacturer} {model} - {name} ({serial})"
-                print(f"Adding sensor: {display_text}")
-                self.sensor_combo.addItem(display_text, serial)
-        
-        # Get all dataloggers
-        print("\nLoading dataloggers...")
-        for datalogger in self.inventory_model.get_dataloggers():
-            name = datalogger.get('name', '')
-            serial = self.inventory_model.xml_handler.get_element_text(datalogger, 'serialNumber')
-            model = self.inventory_model.xml_handler.get_element_text(datalogger, 'model') or ''
-            manufacturer = self.inventory_model.xml_handler.get_element_text(datalogger, 'manufacturer') or ''
-            
-            if serial:  # Only add if has serial number
-                display_text = f"{manufacturer} {model} - {name} ({serial})"
-                print(f"Adding datalogger: {display_text}")
-                self.datalogger_combo.addItem(display_text, serial)
-                
-        print("=======================\n")
+        Returns:
+            dict: Item data -> row of the new items
+        """
+        index: Dict[str, int] = {}
+        current = combo.currentData()
+        
+        # Fill without per-item signals or repaints
+        with QSignalBlocker(combo):
+            combo.setUpdatesEnabled(False)
+            try:
+                displays = [placeholder]
+                names = []
+                for name, manufacturer, model in labels:
+                    displays.append(f"{manufacturer} {model} - {name}"
+                                    if manufacturer or model else name)
+                    names.append(name)
+                    
+                # Insert all rows at once, then attach their data (the placeholder has none)
+                combo.clear()
+                combo.addItems(displays)
+                for row, name in enumerate(names, start=1):
+                    combo.setItemData(row, name)
+                    index.setdefault(name, row)
+                combo.setCurrentIndex(index.get(current, 0))
+            finally:
+                combo.setUpdatesEnabled(True)
+        return index
 
     def set_current_element(self, element: Optional[ET.Element]):
         """Set current stream element and populate fields"""
-        print("\n=== Stream Tab Debug ===")
-        print(f"Setting stream element: {element is not None}")
+        # Commit any pending edit to the element it was made on
+        if self._commit_timer.isActive():
+            self.update_stream_now()
+            
+        self.logger.debug("Setting stream element: %s", element is not None)
         
         self.current_element = element
         if element is None:
@@ -247,22 +262,17 @@ class StreamTab(QWidget):
         # Get stream data
         data = self.inventory_model.get_stream_data(element)
         
-        # Populate fields
-        self.stream_code.setText(data.code)
-        self.stream_start.setText(data.start)
-        self.stream_end.setText(data.end)
-        self.stream_depth.setText(data.depth)
-        self.stream_azimuth.setText(data.azimuth)
-        self.stream_dip.setText(data.dip)
-        self.stream_gain.setText(data.gain)
-        self.stream_sampleRateNumerator.setText(data.sampleRateNumerator)
-        self.stream_sampleRateDenominator.setText(data.sampleRateDenominator)
-        self.stream_gainFrequency.setText(data.gainFrequency)
-        self.stream_gainUnit.setText(data.gainUnit)
-        self.stream_flags.setText(data.flags)
-        
-        print(f"\nSetting sensor serial: {data.sensor_serialnumber}")
-        print(f"Setting datalogger serial: {data.datalogger_serialnumber}")
+        # Populate fields without per-field textChanged validation
+        for key, field in self._fields:
+            with QSignalBlocker(field):
+                field.setText(getattr(data, key))
+                
+        # Validate (and style) each populated field once
+        for _, field in self._fields:
+            field.validate()
+        
+        self.logger.debug("Stream serials - Sensor: %s, Datalogger: %s",
+                          data.sensor_serialnumber, data.datalogger_serialnumber)
         
         # Update display fields
         self.sensor_serial_display.setText(data.sensor_serialnumber or "")
@@ -270,29 +280,27 @@ class StreamTab(QWidget):
         
         # Set combo box selections for sensor and datalogger
         if data.sensor_serialnumber:
-            sensor_index = self.sensor_combo.findData(data.sensor_serialnumber)
-            print(f"Found sensor index: {sensor_index}")
-            if sensor_index >= 0:
-                self.sensor_combo.setCurrentIndex(sensor_index)
+            self.set_sensor_selection(data.sensor_serialnumber)
                 
         if data.datalogger_serialnumber:
-            datalogger_index = self.datalogger_combo.findData(data.datalogger_serialnumber)
-            print(f"Found datalogger index: {datalogger_index}")
-            if datalogger_index >= 0:
-                self.datalogger_combo.setCurrentIndex(datalogger_index)
+            self.set_datalogger_selection(data.datalogger_serialnumber)
                 
-        self.status_label.setText("")
+        self._loaded_data = self.get_current_data()
+        if self.status_label.text():
+            self.status_label.clear()
 
         
     def set_sensor_selection(self, serial: str):
         """Set sensor combo box selection"""
-        index = self.sensor_combo.findData(serial)
+        self.sensor_combo.ensure_loaded()
+        index = self._sensor_index.get(serial, -1)
         if index >= 0:
             self.sensor_combo.setCurrentIndex(index)
             
     def set_datalogger_selection(self, serial: str):
         """Set datalogger combo box selection"""
-        index = self.datalogger_combo.findData(serial)
+        self.datalogger_combo.ensure_loaded()
+        index = self._datalogger_index.get(serial, -1)
         if index >= 0:
             self.datalogger_combo.setCurrentIndex(index)
             
@@ -302,128 +310,97 @@ class StreamTab(QWidget):
            
     def get_current_data(self) -> Dict[str, str]:
         """Get current field values"""
-        return {
-            'code': self.stream_code.text(),
-            'start': self.stream_start.text(),
-            'end': self.stream_end.text(),
-            'depth': self.stream_depth.text(),
-            'azimuth': self.stream_azimuth.text(),
-            'dip': self.stream_dip.text(),
-            'gain': self.stream_gain.text(),
-            'sampleRateNumerator': self.stream_sampleRateNumerator.text().strip(),
-            'sampleRateDenominator': self.stream_sampleRateDenominator.text().strip(),
-            'gainFrequency': self.stream_gainFrequency.text(),
-            'gainUnit': self.stream_gainUnit.text(),
-            'flags': self.stream_flags.text().strip(),
-            'sensorSerialNumber': self.sensor_combo.currentData(),
-            'dataloggerSerialNumber': self.datalogger_combo.currentData()
-        }
+        data = {key: field.text() for key, field in self._fields}
+        for key in _STRIPPED_KEYS:
+            data[key] = data[key].strip()
+        data['sensorSerialNumber'] = self.sensor_combo.currentData()
+        data['dataloggerSerialNumber'] = self.datalogger_combo.currentData()
+        return data
 
 
         
-    def validate_all(self) -> bool:
-        """Validate all input fields"""
-        validations = []
+    def validate_all(self, data: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Validate all input fields
         
+        Args:
+            data: Field values from get_current_data, read from the widgets if omitted
+        """
+        if data is None:
+            data = self.get_current_data()
+            
         # Check required code field
-        code_valid = self.stream_code.validate()
-        if not code_valid:
-            self.status_label.setText("Stream code is required")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-            validations.append(False)
+        if not self.stream_code.validate():
+            self.status_label.set_status("Stream code is required", StatusLabel.ERROR)
+            return False
         
         # Validate dates
-        if self.stream_start.text():
-            start_valid = DateTimeValidator.validate(self.stream_start.text())
-            if not start_valid:
-                self.status_label.setText("Invalid start time format")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                validations.append(False)
-        
-        if self.stream_end.text():
-            end_valid = DateTimeValidator.validate(self.stream_end.text())
-            if not end_valid:
-                self.status_label.setText("Invalid end time format")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                validations.append(False)
+        if data['start']:
+            if not DateTimeValidator.validate(data['start']):
+                self.status_label.set_status("Invalid start time format", StatusLabel.ERROR)
+                return False
+        
+        if data['end']:
+            if not DateTimeValidator.validate(data['end']):
+                self.status_label.set_status("Invalid end time format", StatusLabel.ERROR)
+                return False
         
         # Validate depth
-        if self.stream_depth.text():
-            try:
-                float(self.stream_depth.text())
-            except ValueError:
-                self.status_label.setText("Invalid depth value")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                validations.append(False)
+        if data['depth']:
+            if parse_signed_decimal(data['depth']) is None:
+                self.status_label.set_status("Invalid depth value", StatusLabel.ERROR)
+                return False
         
         # Validate azimuth
-        if self.stream_azimuth.text():
-            try:
-                azimuth = float(self.stream_azimuth.text())
-                if not 0 <= azimuth <= 360:
-                    self.status_label.setText("Azimuth must be between 0 and 360 degrees")
-                    self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                    validations.append(False)
-            except ValueError:
-                self.status_label.setText("Invalid azimuth value")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                validations.append(False)
+        if data['azimuth']:
+            azimuth = parse_signed_decimal(data['azimuth'])
+            if azimuth is None:
+                self.status_label.set_status("Invalid azimuth value", StatusLabel.ERROR)
+                return False
+            elif not 0 <= azimuth <= 360:
+                self.status_label.set_status("Azimuth must be between 0 and 360 degrees", StatusLabel.ERROR)
+                return False
         
         # Validate dip
-        if self.stream_dip.text():
-            try:
-                dip = float(self.stream_dip.text())
-                if not -90 <= dip <= 90:
-                    self.status_label.setText("Dip must be between -90 and 90 degrees")
-                    self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                    validations.append(False)
-            except ValueError:
-                self.status_label.setText("Invalid dip value")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                validations.append(False)
+        if data['dip']:
+            dip = parse_signed_decimal(data['dip'])
+            if dip is None:
+                self.status_label.set_status("Invalid dip value", StatusLabel.ERROR)
+                return False
+            elif not -90 <= dip <= 90:
+                self.status_label.set_status("Dip must be between -90 and 90 degrees", StatusLabel.ERROR)
+                return False
         
         # Validate gain with scientific notation
-        if self.stream_gain.text():
-            try:
-                float(self.stream_gain.text())  # This handles scientific notation properly
-            except ValueError:
-                self.status_label.setText("Invalid gain value")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                validations.append(False)
+        if data['gain']:
+            if _parse_scientific(data['gain']) is None:  # Handles scientific notation
+                self.status_label.set_status("Invalid gain value", StatusLabel.ERROR)
+                return False
         
         # Validate gain frequency
-        if self.stream_gainFrequency.text():
-            try:
-                gain_freq = float(self.stream_gainFrequency.text())
-                if gain_freq < 0:
-                    self.status_label.setText("Gain frequency must be non-negative")
-                    self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                    validations.append(False)
-            except ValueError:
-                self.status_label.setText("Invalid gain frequency value")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                validations.append(False)
+        if data['gainFrequency']:
+            gain_freq = _parse_scientific(data['gainFrequency'])
+            if gain_freq is None:
+                self.status_label.set_status("Invalid gain frequency value", StatusLabel.ERROR)
+                return False
+            if gain_freq < 0:
+                self.status_label.set_status("Gain frequency must be non-negative", StatusLabel.ERROR)
+                return False
         
         # Validate sample rate if present
         if hasattr(self, 'stream_sampleRate') and self.stream_sampleRate.text():
             try:
                 sample_rate = float(self.stream_sampleRate.text())
                 if sample_rate <= 0:
-                    self.status_label.setText("Sample rate must be positive")
-                    self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                    validations.append(False)
+                    self.status_label.set_status("Sample rate must be positive", StatusLabel.ERROR)
+                    return False
             except ValueError:
-                self.status_label.setText("Invalid sample rate value")
-                self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
-                validations.append(False)
-        
-        # Clear status if all validations pass
-        if not False in validations:
-            self.status_label.setText("")
-            self.status_label.setStyleSheet("")
-            return True
+                self.status_label.set_status("Invalid sample rate value", StatusLabel.ERROR)
+                return False
         
-        return False
+        # All validations passed
+        self.status_label.set_status("", StatusLabel.INFO)
+        return True
         
     def validate_numeric(self, value: str, allow_scientific: bool = True) -> bool:
         """Validate numeric values with proper scientific notation support"""
@@ -443,30 +420,42 @@ class StreamTab(QWidget):
         if not self.current_element or not self.inventory_model:
             return
             
-        if not self.validate_all():
-            self.status_label.setText("Please correct the invalid fields")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+        data = self.get_current_data()
+        # Only send the fields that differ from what the element holds
+        diff = {key: value for key, value in data.items()
+                if value != self._loaded_data.get(key)}
+        if not diff:
+            self.status_label.set_status("No changes to update", StatusLabel.INFO)
+            return
+            
+        if not self.validate_all(data):
+            self.status_label.set_status("Please correct the invalid fields", StatusLabel.ERROR)
             return
             
         try:
-            data = self.get_current_data()
             # Remove sampleRate if present in data to prevent the error
-            if 'sampleRate' in data:
-                del data['sampleRate']
+            if 'sampleRate' in diff:
+                del diff['sampleRate']
                 
-            if self.inventory_model.update_stream(self.current_element, data):
-                self.status_label.setText("Stream updated successfully")
-                self.status_label.setStyleSheet("QLabel { color: #5cb85c; }")
-                self.streamUpdated.emit()
+            updated = self.inventory_model.update_stream(self.current_element, diff)
+            self._loaded_data.update(diff)
+            if updated:
+                self.status_label.set_status("Stream updated successfully", StatusLabel.OK)
+                # Let the status label paint before listeners rebuild the tree
+                QTimer.singleShot(0, self.streamUpdated.emit)
             else:
-                self.status_label.setText("No changes to update")
-                self.status_label.setStyleSheet("QLabel { color: #666; }")
+                self.status_label.set_status("No changes to update", StatusLabel.INFO)
                 
         except Exception as e:
-            self.status_label.setText(f"Error updating stream: {str(e)}")
-            self.status_label.setStyleSheet("QLabel { color: #d9534f; }")
+            self.status_label.set_status(f"Error updating stream: {str(e)}", StatusLabel.ERROR)
+            
+            
+    def update_stream_now(self):
+        """Update immediately, cancelling any pending debounced update"""
+        self._commit_timer.stop()
+        self.update_stream()
             
     def handle_editing_finished(self):
         """Called when editing is finished in any field"""
         if self.current_element:
-            self.update_stream()
\ No newline at end of file
+            self._commit_timer.start()
\ No newline at end of file
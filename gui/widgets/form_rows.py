@@ -0,0 +1,13 @@
+# gui/widgets/form_rows.py
+from PyQt5.QtWidgets import QFormLayout, QWidget
+from typing import Iterable, Optional, Tuple
+
+# (label, field, tooltip) for one row of a tab's form; tooltip may be None
+FormRow = Tuple[str, QWidget, Optional[str]]
+
+def add_form_rows(layout: QFormLayout, rows: Iterable[FormRow]):
+    """Add labelled fields to a form layout, setting each field's tooltip"""
+    for label, widget, tooltip in rows:
+        if tooltip:
+            widget.setToolTip(tooltip)
+        layout.addRow(label, widget)
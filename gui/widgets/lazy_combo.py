@@ -0,0 +1,47 @@
+# gui/widgets/lazy_combo.py
+from PyQt5.QtWidgets import QComboBox
+from typing import Any, Callable, Optional
+
+class LazyComboBox(QComboBox):
+    """Combo box that fills itself from a loader only when its items are needed"""
+
+    _UNLOADED = object()  # Stamp that never matches a real one
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Don't measure every item: size from a fixed text length, and let the
+        # popup view assume all rows are as tall as the first
+        self.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.setMinimumContentsLength(30)
+        self.view().setUniformItemSizes(True)
+        self._loader: Optional[Callable[[], None]] = None
+        self._stamp: Optional[Callable[[], Any]] = None
+        self._loaded_stamp: Any = self._UNLOADED
+
+    def set_loader(self, loader: Callable[[], None],
+                   stamp: Optional[Callable[[], Any]] = None):
+        """
+        Set the callable that fills the combo box
+
+        Args:
+            loader: Called to (re)fill the items
+            stamp: Returns a value that changes whenever the items would differ;
+                   without it the combo box is filled only once
+        """
+        self._loader = loader
+        self._stamp = stamp
+        self._loaded_stamp = self._UNLOADED
+
+    def ensure_loaded(self):
+        """Run the loader unless the items are already up to date"""
+        if self._loader is None:
+            return
+        stamp = self._stamp() if self._stamp else None
+        if stamp != self._loaded_stamp:
+            self._loaded_stamp = stamp
+            self._loader()
+
+    def showPopup(self):
+        """Fill the items before the popup opens"""
+        self.ensure_loaded()
+        super().showPopup()
@@ -0,0 +1,42 @@
+# gui/widgets/status_label.py
+from PyQt5.QtWidgets import QLabel
+
+# Colors are selected via the dynamic 'state' property, so switching state
+# only repolishes the label instead of parsing a new stylesheet
+_STATUS_LABEL_QSS = """
+    QLabel {
+        color: #666;
+        padding: 5px;
+    }
+    QLabel[state="err"] { color: #d9534f; }
+    QLabel[state="ok"] { color: #5cb85c; }
+    QLabel[state="info"] { color: #666; }
+"""
+
+class StatusLabel(QLabel):
+    """Label showing the outcome of the last action in a tab"""
+
+    ERROR = 'err'
+    OK = 'ok'
+    INFO = 'info'
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setStyleSheet(_STATUS_LABEL_QSS)
+        self.setProperty('state', self.INFO)
+
+    def set_status(self, message: str, state: str = INFO):
+        """
+        Show a status message
+
+        Args:
+            message: Text to show
+            state: StatusLabel.ERROR, StatusLabel.OK or StatusLabel.INFO
+        """
+        if message != self.text():
+            self.setText(message)
+        if self.property('state') != state:
+            self.setProperty('state', state)
+            style = self.style()
+            style.unpolish(self)
+            style.polish(self)
@@ -1,63 +1,125 @@
 # gui/widgets/tree_widget.py
-from PyQt5.QtWidgets import QTreeWidget, QTreeWidgetItem, QTreeWidgetItemIterator
+from PyQt5.QtWidgets import QTreeWidget, QTreeWidgetItem
 from PyQt5.QtCore import Qt, pyqtSignal
 from typing import Dict, List, Optional, Any, Tuple
+from pathlib import Path
+from functools import lru_cache
+import logging
 from xml.etree import ElementTree as ET
 
+# Branch indicator images, shipped next to this module
+_ICON_DIR = Path(__file__).resolve().parent / 'icons'
+
+# Tree styling with expand/collapse indicators
+_TREE_QSS = """
+    QTreeWidget {
+        border: 1px solid #ccc;
+        border-radius: 3px;
+        padding: 5px;
+        background-color: white;
+    }
+    QTreeWidget::item {
+        padding: 5px;
+        padding-right: 10px;
+    }
+    QTreeWidget::item:selected {
+        background-color: #e6f3ff;
+        color: black;
+    }
+    QTreeWidget::item:hover {
+        background-color: #f5f5f5;
+    }
+    QTreeWidget::branch {
+        background: transparent;
+    }
+    QTreeWidget::branch:has-children:!has-siblings:closed,
+    QTreeWidget::branch:closed:has-children:has-siblings {
+        image: url("%(closed)s");
+        padding: 2px;
+    }
+    QTreeWidget::branch:has-children:!has-siblings:open,
+    QTreeWidget::branch:open:has-children:has-siblings {
+        image: url("%(open)s");
+        padding: 2px;
+    }
+    QTreeWidget::branch:!has-children:!has-siblings,
+    QTreeWidget::branch:!has-children:has-siblings {
+        border: none;
+    }
+""" % {
+    'closed': (_ICON_DIR / 'branch-closed.svg').as_posix(),
+    'open': (_ICON_DIR / 'branch-open.svg').as_posix(),
+}
+
+# Rank of the orientation code within a band/instrument group
+_ORIENTATION_ORDER = {
+    'E': 0, '1': 0,  # E and 1 are equivalent
+    'N': 1, '2': 1,  # N and 2 are equivalent
+    'Z': 2,          # Z always comes last
+}
+
+@lru_cache(maxsize=4096)
+def _code_sort_key(code: str) -> tuple:
+    """Sort key of a stream code: (band code, instrument code, orientation rank)"""
+    if len(code) < 3:
+        return ('', '', 999)
+    return (code[0], code[1], _ORIENTATION_ORDER.get(code[2], 3))
+
+def _stream_sort_key(stream: ET.Element) -> tuple:
+    """Sort key of a stream, memoized by its code"""
+    return _code_sort_key(stream.get('code', ''))
+
+# Child level built when an item of the given type is expanded:
+# (child type, xml_handler getter of the children, getter of their children)
+_CHILD_LEVELS = {
+    'network': ('station', 'get_stations', 'get_locations'),
+    'station': ('location', 'get_locations', 'get_streams'),
+    'location': ('stream', 'get_streams', None),
+}
+
+# Item data role marking that an item's children have been built
+_POPULATED_ROLE = Qt.UserRole + 1
+
 class TreeWidgetWithKeyboardNav(QTreeWidget):
     """Enhanced QTreeWidget with keyboard navigation"""
     
     elementSelected = pyqtSignal(str, ET.Element)  # Signal for element selection
+    elementActivated = pyqtSignal(str, ET.Element)  # Signal for Enter on an element
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.xml_handler = None
+        self.logger = logging.getLogger('TreeWidget')
         self.setFocusPolicy(Qt.StrongFocus)
         self.currentItemChanged.connect(self._handle_current_item_changed)
+        self.itemExpanded.connect(self._populate_children)
+        
+        # Items currently expanded, by id (QTreeWidgetItem is not hashable),
+        # so saving the state doesn't walk the tree
+        self._expanded_items: Dict[int, QTreeWidgetItem] = {}
+        self.itemExpanded.connect(self._on_item_expanded)
+        self.itemCollapsed.connect(self._on_item_collapsed)
+        
+        # Keys handled here; everything else goes to QTreeWidget
+        self._key_handlers = {
+            Qt.Key_Return: self._on_activate_key,
+            Qt.Key_Enter: self._on_activate_key,
+            Qt.Key_Right: self._on_right_key,
+            Qt.Key_Left: self._on_left_key,
+            Qt.Key_Home: self._on_home_key,
+            Qt.Key_End: self._on_end_key,
+        }
         self.setup_style()
         
     def setup_style(self):
         """Setup widget styling with improved expand/collapse indicators"""
-        self.setStyleSheet("""
-            QTreeWidget {
-                border: 1px solid #ccc;
-                border-radius: 3px;
-                padding: 5px;
-                background-color: white;
-            }
-            QTreeWidget::item {
-                padding: 5px;
-                padding-right: 10px;
-            }
-            QTreeWidget::item:selected {
-                background-color: #e6f3ff;
-                color: black;
-            }
-            QTreeWidget::item:hover {
-                background-color: #f5f5f5;
-            }
-            QTreeWidget::branch {
-                background: transparent;
-            }
-            QTreeWidget::branch:has-children:!has-siblings:closed,
-            QTreeWidget::branch:closed:has-children:has-siblings {
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj48cGF0aCBkPSJNNCAxMGw0LTQtNC00IiBzdHJva2U9IiM2NjY2NjYiIHN0cm9rZS13aWR0aD0iMiIgZmlsbD0ibm9uZSIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+PC9zdmc+);
-                padding: 2px;
-            }
-            QTreeWidget::branch:has-children:!has-siblings:open,
-            QTreeWidget::branch:open:has-children:has-siblings {
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj48cGF0aCBkPSJNMiA0bDQgNCA0LTQiIHN0cm9rZT0iIzY2NjY2NiIgc3Ryb2tlLXdpZHRoPSIyIiBmaWxsPSJub25lIiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiLz48L3N2Zz4=);
-                padding: 2px;
-            }
-            QTreeWidget::branch:!has-children:!has-siblings,
-            QTreeWidget::branch:!has-children:has-siblings {
-                border: none;
-            }
-        """)
+        self.setStyleSheet(_TREE_QSS)
 
         # Additional visual settings
         self.setIndentation(20)  # Increase indentation for better hierarchy visibility
         self.setAnimated(True)  # Enable animations for expand/collapse
         self.setExpandsOnDoubleClick(True)  # Allow double-click to expand
+        self.setUniformRowHeights(True)  # All rows are single-line text; size from the first
         
     def _handle_current_item_changed(self, current: QTreeWidgetItem, previous: QTreeWidgetItem):
         """Handle item selection change with improved stability"""
@@ -65,273 +127,288 @@ class TreeWidgetWithKeyboardNav(QTreeWidget):
             return
             
         try:
-            self.itemClicked.emit(current, 0)
             data = current.data(0, Qt.UserRole)
             
-            # More robust type checking
-            if not data:
-                print("Warning: No data associated with tree item")
-                return
-                
-            # Handle both tuple data and direct element data
+            # _create_tree_item stores (element_type, element) on every element
+            # item; section headers carry no data
             if isinstance(data, tuple):
-                if len(data) == 2 and isinstance(data[0], str) and isinstance(data[1], ET.Element):
-                    self.elementSelected.emit(data[0], data[1])
-                else:
-                    print(f"Warning: Invalid tuple data format: {data}")
-            elif isinstance(data, ET.Element):
-                # Try to determine type from element tag
-                element_type = data.tag.split('}')[-1].lower()
-                self.elementSelected.emit(element_type, data)
-            else:
-                print(f"Warning: Unexpected data type in tree item: {type(data)}")
+                self.elementSelected.emit(data[0], data[1])
+            elif data is not None:
+                self.logger.warning("Unexpected data type in tree item: %s", type(data))
                 
         except Exception as e:
-            print(f"Error handling tree item selection: {str(e)}")
+            # Slots run synchronously inside emit; keep their errors out of Qt
+            self.logger.error("Error handling tree item selection: %s", e)
               
     def keyPressEvent(self, event):
         """Handle keyboard navigation"""
-        key = event.key()
-        current_item = self.currentItem()
-        
-        if key == Qt.Key_Return or key == Qt.Key_Enter:
-            if current_item:
-                self.itemClicked.emit(current_item, 0)
-                
-        elif key == Qt.Key_Right:
-            if current_item and not current_item.isExpanded():
-                current_item.setExpanded(True)
-            elif current_item and current_item.childCount() > 0:
-                self.setCurrentItem(current_item.child(0))
-                
-        elif key == Qt.Key_Left:
-            if current_item:
-                if current_item.isExpanded():
-                    current_item.setExpanded(False)
-                else:
-                    parent = current_item.parent()
-                    if parent:
-                        self.setCurrentItem(parent)
-                        
-        elif key == Qt.Key_Home:
-            first_item = self.topLevelItem(0)
-            if first_item:
-                self.setCurrentItem(first_item)
-                
-        elif key == Qt.Key_End:
-            last_item = self.get_last_visible_item()
-            if last_item:
-                self.setCurrentItem(last_item)
-                
-        elif key in (Qt.Key_Up, Qt.Key_Down, Qt.Key_PageUp, Qt.Key_PageDown):
-            super().keyPressEvent(event)
+        handler = self._key_handlers.get(event.key())
+        if handler is not None:
+            handler(self.currentItem())
         else:
             super().keyPressEvent(event)
             
+    def _on_activate_key(self, current_item: Optional[QTreeWidgetItem]):
+        """Return/Enter: activate the current element item"""
+        if current_item:
+            data = current_item.data(0, Qt.UserRole)
+            if isinstance(data, tuple):
+                self.elementActivated.emit(data[0], data[1])
+            
+    def _on_right_key(self, current_item: Optional[QTreeWidgetItem]):
+        """Right: expand the current item, or move to its first child"""
+        if current_item and not current_item.isExpanded():
+            current_item.setExpanded(True)
+        elif current_item and current_item.childCount() > 0:
+            self.setCurrentItem(current_item.child(0))
+            
+    def _on_left_key(self, current_item: Optional[QTreeWidgetItem]):
+        """Left: collapse the current item, or move to its parent"""
+        if current_item:
+            if current_item.isExpanded():
+                current_item.setExpanded(False)
+            else:
+                parent = current_item.parent()
+                if parent:
+                    self.setCurrentItem(parent)
+                    
+    def _on_home_key(self, current_item: Optional[QTreeWidgetItem]):
+        """Home: move to the first item"""
+        first_item = self.topLevelItem(0)
+        if first_item:
+            self.setCurrentItem(first_item)
+            
+    def _on_end_key(self, current_item: Optional[QTreeWidgetItem]):
+        """End: move to the last visible item"""
+        last_item = self.get_last_visible_item()
+        if last_item:
+            self.setCurrentItem(last_item)
+            
     def get_last_visible_item(self) -> Optional[QTreeWidgetItem]:
         """Get the last visible item in the tree"""
         last_item = self.topLevelItem(self.topLevelItemCount() - 1)
         if not last_item:
             return None
             
-        while last_item.isExpanded() and last_item.childCount() > 0:
-            last_item = last_item.child(last_item.childCount() - 1)
+        # Follow the last child down the expanded spine, asking each
+        # level for its child count once
+        while last_item.isExpanded():
+            count = last_item.childCount()
+            if not count:
+                break
+            last_item = last_item.child(count - 1)
             
         return last_item
         
+    @staticmethod
+    def _item_path(item: QTreeWidgetItem) -> str:
+        """Path of an item, e.g. "Network/Station/Location" """
+        parts = []
+        while item is not None:
+            parts.append(item.text(0))
+            item = item.parent()
+        return '/'.join(reversed(parts))
+        
+    def _on_item_expanded(self, item: QTreeWidgetItem):
+        """Remember an expanded item"""
+        self._expanded_items[id(item)] = item
+        
+    def _on_item_collapsed(self, item: QTreeWidgetItem):
+        """Forget a collapsed item"""
+        self._expanded_items.pop(id(item), None)
+        
     def save_expanded_state(self) -> List[str]:
         """Save the current expanded state"""
-        expanded_items = []
-        iterator = QTreeWidgetItemIterator(self)
-        while iterator.value():
-            item = iterator.value()
-            if item.isExpanded():
-                # Save the path to this item (e.g., "Network/Station/Location")
-                path = []
-                current = item
-                while current:
-                    path.insert(0, current.text(0))
-                    current = current.parent()
-                expanded_items.append('/'.join(path))
-            iterator += 1
-        return expanded_items
+        # Re-check each item: Qt can change expansion without signals
+        return [self._item_path(item) for item in self._expanded_items.values()
+                if item.isExpanded()]
         
     def restore_expanded_state(self, expanded_items: List[str]):
         """Restore previously saved expanded state"""
         if not expanded_items:
             return
             
-        def expand_path(item: QTreeWidgetItem, path_parts: List[str]):
-            """Recursively expand items matching the path"""
-            if not path_parts:
-                return
-                
-            for i in range(item.childCount()):
-                child = item.child(i)
-                if child.text(0) == path_parts[0]:
-                    if len(path_parts) == 1:
-                        child.setExpanded(True)
-                    else:
-                        child.setExpanded(True)
-                        expand_path(child, path_parts[1:])
-        
-        # Process each saved path
+        # Merge the saved paths into a trie of item texts, so a saved path
+        # also expands its ancestors
+        trie: Dict[str, dict] = {}
         for path in expanded_items:
-            path_parts = path.split('/')
-            # Start from root items
-            for i in range(self.topLevelItemCount()):
-                root_item = self.topLevelItem(i)
-                if root_item.text(0) == path_parts[0]:
-                    root_item.setExpanded(True)
-                    if len(path_parts) > 1:
-                        expand_path(root_item, path_parts[1:])
-                        
+            node = trie
+            for part in path.split('/'):
+                node = node.setdefault(part, {})
+                
+        # Expand without scheduling an animation per item
+        was_animated = self.isAnimated()
+        self.setAnimated(False)
+        try:
+            # Walk down only the matching items; expanding an item builds its
+            # children, so they can be visited right after. Several items can
+            # share a path (e.g. epochs with the same code), each is expanded
+            stack = [(self.topLevelItem(i), trie) for i in range(self.topLevelItemCount())]
+            while stack:
+                item, node = stack.pop()
+                subtrie = node.get(item.text(0))
+                if subtrie is None:
+                    continue
+                item.setExpanded(True)
+                if subtrie:
+                    stack.extend((item.child(i), subtrie) for i in range(item.childCount()))
+        finally:
+            self.setAnimated(was_animated)
+            
     def populate_inventory(self, xml_handler):
-        """Populate tree with inventory data with visual indicators for expandable items"""
+        """
+        Populate tree with inventory data with visual indicators for expandable items
+        
+        Only networks and the Sensors/Dataloggers sections are built here; the
+        children of a network, station or location are built when it is first
+        expanded.
+        """
+        self.xml_handler = xml_handler
+        
+        # Build the top level detached and attach it at once, without
+        # per-insert repaints or item change signals
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
         try:
             self.clear()
+            self._expanded_items.clear()
             
             # Get inventory element with proper error checking
             inventory = xml_handler.root.find('sc3:Inventory', xml_handler.ns)
             if inventory is None:
-                print("Warning: No inventory found in XML")
+                self.logger.warning("No inventory found in XML")
                 return
-
-            def create_tree_item(parent, text, element_type, element):
-                """Helper function to create tree items with proper visual indicators"""
-                item = QTreeWidgetItem(parent)
-                item.setText(0, text)
-                item.setData(0, Qt.UserRole, (element_type, element))
-                
-                # Add visual indicator if item will have children
-                has_children = False
-                if element_type == 'network':
-                    has_children = len(xml_handler.get_stations(element)) > 0
-                elif element_type == 'station':
-                    has_children = len(xml_handler.get_locations(element)) > 0
-                elif element_type == 'location':
-                    has_children = len(xml_handler.get_streams(element)) > 0
-                
-                if has_children:
-                    # Set a custom icon or marker for items with children
-                    item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
-                else:
-                    item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicator)
-                
-                return item
+            
+            top_items = []
+            # Bind what the loops call per item once
+            create_item = self._create_tree_item
+            get_stations = xml_handler.get_stations
+            get_text = xml_handler.get_element_text
             
             # Add networks
             for network in xml_handler.get_networks():
-                try:
-                    network_code = network.get('code', '')
-                    network_item = create_tree_item(
-                        self, 
-                        f"Network: {network_code}", 
-                        'network', 
-                        network
-                    )
-                    
-                    # Add stations
-                    for station in xml_handler.get_stations(network):
-                        try:
-                            station_code = station.get('code', '')
-                            station_item = create_tree_item(
-                                network_item,
-                                f"Station: {station_code}",
-                                'station',
-                                station
-                            )
-                            
-                            # Add locations
-                            for location in xml_handler.get_locations(station):
-                                try:
-                                    location_code = location.get('code', '')
-                                    location_item = create_tree_item(
-                                        station_item,
-                                        f"Location: {location_code}",
-                                        'location',
-                                        location
-                                    )
-                                    
-                                    # Add streams
-                                    streams = xml_handler.get_streams(location)
-                                    for stream in self.sort_streams(streams):
-                                        try:
-                                            stream_code = stream.get('code', '')
-                                            create_tree_item(
-                                                location_item,
-                                                f"Stream: {stream_code}",
-                                                'stream',
-                                                stream
-                                            )
-                                        except Exception as e:
-                                            print(f"Error adding stream item: {str(e)}")
-                                            continue
-                                            
-                                except Exception as e:
-                                    print(f"Error adding location item: {str(e)}")
-                                    continue
-                                    
-                        except Exception as e:
-                            print(f"Error adding station item: {str(e)}")
-                            continue
-                            
-                except Exception as e:
-                    print(f"Error adding network item: {str(e)}")
-                    continue
+                top_items.append(create_item(
+                    f"Network: {network.get('code', '')}", 
+                    'network', 
+                    network,
+                    bool(get_stations(network))
+                ))
 
             # Add special sections (Sensors and Dataloggers)
             def add_special_section(title, items, item_type):
                 if items:
-                    section_item = QTreeWidgetItem(self)
+                    section_item = QTreeWidgetItem()
                     section_item.setText(0, title)
-                    section_item.setChildIndicatorPolicy(
-                        QTreeWidgetItem.ShowIndicator if items else QTreeWidgetItem.DontShowIndicator
-                    )
+                    section_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
                     
+                    element_type = item_type.lower()
+                    child_items = []
                     for item in items:
-                        try:
-                            name = item.get('name', '')
-                            serial = xml_handler.get_element_text(item, 'serialNumber')
-                            child_item = create_tree_item(
-                                section_item,
-                                f"{item_type}: {name} ({serial})" if serial else f"{item_type}: {name}",
-                                item_type.lower(),
-                                item
-                            )
-                        except Exception as e:
-                            print(f"Error adding {item_type} item: {str(e)}")
-                            continue
+                        name = item.get('name', '')
+                        serial = get_text(item, 'serialNumber')
+                        child_items.append(create_item(
+                            f"{item_type}: {name} ({serial})" if serial else f"{item_type}: {name}",
+                            element_type,
+                            item
+                        ))
+                    section_item.addChildren(child_items)
+                    top_items.append(section_item)
 
             add_special_section("Sensors", xml_handler.get_sensors(), "Sensor")
             add_special_section("Dataloggers", xml_handler.get_dataloggers(), "Datalogger")
+            
+            self.addTopLevelItems(top_items)
 
         except Exception as e:
-            print(f"Error populating inventory tree: {str(e)}")
+            self.logger.error("Error populating inventory tree: %s", e)
             self.clear()
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            
+    @staticmethod
+    def _create_tree_item(text: str, element_type: str, element: ET.Element,
+                          has_children: bool = False) -> QTreeWidgetItem:
+        """Create a detached tree item with proper visual indicators"""
+        item = QTreeWidgetItem()
+        item.setText(0, text)
+        item.setData(0, Qt.UserRole, (element_type, element))
+        
+        # Add visual indicator if item will have children
+        if has_children:
+            # Set a custom icon or marker for items with children
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        else:
+            item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicator)
+        
+        return item
+        
+    def _populate_children(self, item: QTreeWidgetItem):
+        """Build the children of a network, station or location on first expand"""
+        data = item.data(0, Qt.UserRole)
+        if not isinstance(data, tuple) or item.data(0, _POPULATED_ROLE):
+            return
+        item.setData(0, _POPULATED_ROLE, True)
+        
+        element_type, element = data
+        level = _CHILD_LEVELS.get(element_type)
+        if level is None:
+            return
+        child_type, get_children, get_grandchildren = level
+        
+        xml_handler = self.xml_handler
+        children = []
+        
+        # One guard around the whole build instead of one per child item
+        try:
+            elements = getattr(xml_handler, get_children)(element)
+            if child_type == 'stream':
+                elements = self.sort_streams(elements)
+            grandchildren_of = getattr(xml_handler, get_grandchildren) if get_grandchildren else None
+            
+            label = f"{child_type.capitalize()}: "
+            create_item = self._create_tree_item
+            children = [
+                create_item(label + child.get('code', ''), child_type, child,
+                            bool(grandchildren_of(child)) if grandchildren_of else False)
+                for child in elements
+            ]
+        except Exception as e:
+            self.logger.error("Error adding %s children: %s", element_type, e)
+            
+        item.addChildren(children)
                 
+    def expandAll(self):
+        """Build every subtree not built yet, then expand the whole tree"""
+        # QTreeView.expandAll does not emit itemExpanded, so the lazy
+        # subtrees have to be built here first
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            parents = {}
+            stack = [self.topLevelItem(i) for i in range(self.topLevelItemCount())]
+            while stack:
+                item = stack.pop()
+                self._populate_children(item)
+                count = item.childCount()
+                if count:
+                    parents[id(item)] = item
+                    stack.extend(item.child(i) for i in range(count))
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        super().expandAll()
+        self._expanded_items = parents
+        
+    def collapseAll(self):
+        """Collapse the whole tree and forget the expanded items"""
+        super().collapseAll()
+        self._expanded_items.clear()
+        
     def sort_streams(self, streams: List[ET.Element]) -> List[ET.Element]:
         """
         Sort streams according to seismological convention:
         1. First by band and instrument code (B, H, etc.)
         2. Then by orientation (E/1, N/2, Z) or (1, 2, Z)
         """
-        def get_sort_key(stream: ET.Element) -> tuple:
-            code = stream.get('code', '')
-            if not code or len(code) < 3:
-                return ('', '', 999)
-                
-            band_code = code[0]
-            instrument_code = code[1]
-            orientation = code[2]
-            
-            orientation_order = {
-                'E': 0, '1': 0,  # E and 1 are equivalent
-                'N': 1, '2': 1,  # N and 2 are equivalent
-                'Z': 2,          # Z always comes last
-            }
-            orientation_value = orientation_order.get(orientation, 3)
-            
-            return (band_code, instrument_code, orientation_value)
-            
-        return sorted(streams, key=get_sort_key)
+        return sorted(streams, key=_stream_sort_key)
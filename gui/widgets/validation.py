@@ -1,34 +1,204 @@
 from PyQt5.QtWidgets import QLineEdit
-from typing import Optional, Callable, Union
+from PyQt5.QtGui import QRegExpValidator
+from PyQt5.QtCore import QRegExp, QObject, QTimer, pyqtSignal
+from enum import IntEnum
+from functools import partial
+from typing import Optional, Callable, Union, Dict
+import re
 from core.datetime_validation import DateTimeValidator
 
+_ALNUM_RE = re.compile(r'[A-Za-z0-9]+')
+
+
+def parse_signed_decimal(text: str) -> Optional[float]:
+    """
+    Parse an optionally signed decimal number in a single pass
+    
+    Args:
+        text: String of the form -?digits[.digits]
+        
+    Returns:
+        float: Parsed value or None if invalid
+    """
+    if not text or text[0] not in '-.0123456789':
+        return None
+    seen_digit = False
+    seen_dot = False
+    for i, ch in enumerate(text):
+        if 0 <= ord(ch) - 48 <= 9:
+            seen_digit = True
+        elif ch == '.' and not seen_dot:
+            seen_dot = True
+        elif ch != '-' or i:
+            return None
+    return float(text) if seen_digit else None
+
+def is_nonneg_decimal(text: str) -> bool:
+    """Check in a single pass that text is digits with at most one '.', or empty"""
+    seen_digit = False
+    seen_dot = False
+    for ch in text:
+        if '0' <= ch <= '9':
+            seen_digit = True
+        elif ch == '.' and not seen_dot:
+            seen_dot = True
+        else:
+            return False
+    return seen_digit or not text
+
+def decimal_in_range(text: str, low: float, high: float) -> bool:
+    """Check that text parses as a decimal within [low, high]"""
+    value = parse_signed_decimal(text)
+    return value is not None and low <= value <= high
+
+# Characters that may be typed into numeric and datetime fields. Every
+# prefix of a complete value matches, including the empty string, so Qt
+# reports the text as Acceptable and still emits editingFinished; ranges
+# and complete formats are checked by the field validators
+NUMBER_INPUT_PATTERN = r'^-?\d*\.?\d*([eE][+-]?\d*)?$'
+DATETIME_INPUT_PATTERN = (r'^\d{0,4}(-\d{0,2}(-\d{0,2}([ T]\d{0,2}'
+                          r'(:\d{0,2}(:\d{0,2}(\.\d*)?)?)?Z?)?)?)?$')
+
+
+def double_input_validator(parent: Optional[QObject] = None) -> QRegExpValidator:
+    """Create a Qt validator that only lets number-shaped text be typed"""
+    return QRegExpValidator(QRegExp(NUMBER_INPUT_PATTERN), parent)
+
+def datetime_input_validator(parent: Optional[QObject] = None) -> QRegExpValidator:
+    """Create a Qt validator that only lets datetime-shaped text be typed"""
+    return QRegExpValidator(QRegExp(DATETIME_INPUT_PATTERN), parent)
+
+_BOOL_VALUES = frozenset(('true', 'false', ''))
+
+
+def _bool_validator(text: str) -> bool:
+    """Accept 'true'/'false' in any case, or empty"""
+    return text.lower() in _BOOL_VALUES
+
+def _required_validator(text: str) -> bool:
+    """Accept any text that is not just whitespace"""
+    return bool(text.strip())
+
+def _digits_validator(text: str) -> bool:
+    """Accept ASCII digits only, or empty"""
+    return not text or (text.isascii() and text.isdigit())
+
+class VKind(IntEnum):
+    """Built-in validator kinds; string names such as 'datetime' select these too"""
+    NONE = 0
+    DATETIME = 1
+    LAT = 2
+    LON = 3
+    DECIMAL = 4
+    ALNUM = 5
+    BOOL = 6
+    REQUIRED = 7
+    DIGITS = 8
+
+def _decimal_validator(text: str) -> bool:
+    """Accept an optionally signed decimal"""
+    return parse_signed_decimal(text) is not None
+
+def _alnum_validator(text: str) -> bool:
+    """Accept ASCII letters and digits only"""
+    return _ALNUM_RE.fullmatch(text) is not None
+
+# Checks for the built-in validator kinds, shared by all ValidationLineEdit instances
+VALIDATORS: Dict[VKind, Callable[[str], bool]] = {
+    VKind.DATETIME: DateTimeValidator.validate,
+    VKind.LAT: partial(decimal_in_range, low=-90, high=90),
+    VKind.LON: partial(decimal_in_range, low=-180, high=180),
+    VKind.DECIMAL: _decimal_validator,
+    VKind.ALNUM: _alnum_validator,
+    VKind.BOOL: _bool_validator,
+    VKind.REQUIRED: _required_validator,
+    VKind.DIGITS: _digits_validator,
+}
+
+# Line edit styles for valid and invalid input
+_DEFAULT_QSS = """
+    QLineEdit {
+        padding: 5px;
+        border: 1px solid #ccc;
+        border-radius: 3px;
+        background-color: white;
+    }
+    QLineEdit:focus {
+        border-color: #66afe9;
+    }
+"""
+
+_ERROR_QSS = """
+    QLineEdit {
+        padding: 5px;
+        border: 1px solid #d9534f;
+        border-radius: 3px;
+        background-color: #ffe6e6;
+    }
+    QLineEdit:focus {
+        border-color: #d43f3a;
+    }
+"""
+
 class ValidationLineEdit(QLineEdit):
     """Line edit with validation and styling"""
     
+    validationChanged = pyqtSignal(bool)  # Emitted when the field turns valid or invalid
+    
     def __init__(self, 
-                 validator: Optional[Union[Callable[[str], bool], str]] = None,
+                 validator: Optional[Union[Callable[[str], bool], str, VKind]] = None,
                  required: bool = False,
                  parent: Optional[QLineEdit] = None):
         super().__init__(parent)
-        self.validator_type = None
         self.required = required
+        self._vkind = VKind.NONE
+        
+        # Most recently validated text and its result
+        self._last_text: Optional[str] = None
+        self._last_result = True
+        self._error_styled: Optional[bool] = None  # Style applied last, None before the first
         
-        # Handle datetime validator specially
-        if isinstance(validator, str) and validator == 'datetime':
-            self.validator = DateTimeValidator.validate
-            self.validator_type = 'datetime'
+        # Named validators are the built-in kinds, e.g. 'datetime' is VKind.DATETIME
+        if isinstance(validator, str):
+            validator = VKind[validator.upper()]
+        if isinstance(validator, VKind):
+            self._vkind = validator
+            self.validator = VALIDATORS.get(validator)
         else:
             self.validator = validator
             
+        # Validate once typing pauses rather than on every keystroke
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(150)
+        self._validate_timer.timeout.connect(self.validate)
+        
         # Connect signals
-        self.textChanged.connect(self.validate)
+        self.textChanged.connect(self._schedule_validation)
         self.editingFinished.connect(self.on_editing_finished)
         self.apply_default_style()
         
+    def _schedule_validation(self):
+        """Restart the validation delay after a text change"""
+        self._validate_timer.start()
+        
     def validate(self) -> bool:
         """Validate current text and handle datetime conversion"""
-        text = self.text().strip()
+        self._validate_timer.stop()
+        text = self.text()
+        if text == self._last_text:
+            return self._last_result
+            
+        result = self._validate_text(text.strip())
+        # Datetime conversion may have replaced the text
+        self._last_text = self.text()
+        if result != self._last_result:
+            self._last_result = result
+            self.validationChanged.emit(result)
+        return result
         
+    def _validate_text(self, text: str) -> bool:
+        """Validate stripped text, apply styling and convert datetimes"""
         # Check required field
         if not text and self.required:
             self.apply_error_style()
@@ -47,7 +217,7 @@ class ValidationLineEdit(QLineEdit):
                     return False
                     
                 # Handle datetime conversion
-                if self.validator_type == 'datetime' and text:
+                if self._vkind == VKind.DATETIME:
                     converted = DateTimeValidator.convert_to_seiscomp_format(text)
                     if converted and converted != text:
                         # Block signals to prevent recursive validation
@@ -64,38 +234,31 @@ class ValidationLineEdit(QLineEdit):
         
     def apply_default_style(self):
         """Apply default styling"""
-        self.setStyleSheet("""
-            QLineEdit {
-                padding: 5px;
-                border: 1px solid #ccc;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QLineEdit:focus {
-                border-color: #66afe9;
-            }
-        """)
+        if self._error_styled is not False:
+            self._error_styled = False
+            self.setStyleSheet(_DEFAULT_QSS)
         
     def apply_error_style(self):
         """Apply error styling"""
-        self.setStyleSheet("""
-            QLineEdit {
-                padding: 5px;
-                border: 1px solid #d9534f;
-                border-radius: 3px;
-                background-color: #ffe6e6;
-            }
-            QLineEdit:focus {
-                border-color: #d43f3a;
-            }
-        """)
+        if self._error_styled is not True:
+            self._error_styled = True
+            self.setStyleSheet(_ERROR_QSS)
+        
+    def clear(self):
+        """Clear text and forget the cached validation result"""
+        self._last_text = None
+        super().clear()
         
     def on_editing_finished(self):
         """Handle editing finished event"""
+        # Settle a pending validation before the parent acts on the field
+        if self._validate_timer.isActive():
+            self.validate()
         if self.parent() and hasattr(self.parent(), 'handle_editing_finished'):
             self.parent().handle_editing_finished()
             
     def validate_and_get(self) -> tuple[bool, str]:
         """Validate and return current text"""
         is_valid = self.validate()
-        return is_valid, self.text().strip()
\ No newline at end of file
+        return is_valid, self.text().strip()
+
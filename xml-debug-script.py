@@ -2,28 +2,43 @@
 import xml.etree.ElementTree as ET
 import sys
 
-def print_element_structure(element, level=0):
-    """Print the complete structure of an XML element"""
-    indent = "  " * level
+def print_element_structure(xml_file):
+    """Print the complete structure of an XML file, streaming it"""
+    # Open elements whose start tag has been printed, with whether their
+    # text has been printed yet
+    stack = []
+    write = sys.stdout.write
     
-    # Print current element
-    print(f"{indent}<{element.tag}", end="")
+    def print_text(entry):
+        element, text_printed = entry
+        if not text_printed:
+            entry[1] = True
+            # Print text content if any (and not just whitespace)
+            if element.text and element.text.strip():
+                write(f"{'  ' * len(stack)}{element.text.strip()}\n")
     
-    # Print attributes if any
-    for key, value in element.attrib.items():
-        print(f' {key}="{value}"', end="")
-    print(">")
-    
-    # Print text content if any (and not just whitespace)
-    if element.text and element.text.strip():
-        print(f"{indent}  {element.text.strip()}")
-    
-    # Print all child elements
-    for child in element:
-        print_element_structure(child, level + 1)
-    
-    # Print closing tag
-    print(f"{indent}</{element.tag}>")
+    for event, element in ET.iterparse(xml_file, events=('start', 'end')):
+        if event == 'start':
+            # The parent's text precedes this child, so it is complete now
+            if stack:
+                print_text(stack[-1])
+                
+            # Print current element and its attributes in one write
+            attributes = ''.join(f' {key}="{value}"' for key, value in element.attrib.items())
+            write(f"{'  ' * len(stack)}<{element.tag}{attributes}>\n")
+            
+            stack.append([element, False])
+        else:
+            print_text(stack[-1])
+            stack.pop()
+            
+            # Print closing tag
+            write(f"{'  ' * len(stack)}</{element.tag}>\n")
+            
+            # Release the finished subtree; it is the parent's last child so far
+            element.clear()
+            if stack:
+                del stack[-1][0][-1]
 
 def main():
     if len(sys.argv) != 2:
@@ -32,9 +47,7 @@ def main():
 
     xml_file = sys.argv[1]
     try:
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
-        print_element_structure(root)
+        print_element_structure(xml_file)
     except Exception as e:
         print(f"Error processing XML file: {str(e)}")
         sys.exit(1)